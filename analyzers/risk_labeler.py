@@ -2,7 +2,8 @@
 Relative risk labeling utilities.
 """
 
-from typing import Callable, List, TypeVar
+from operator import itemgetter
+from typing import Callable, List, Tuple, TypeVar
 import math
 
 T = TypeVar("T")
@@ -24,23 +25,22 @@ def apply_relative_risk_labels(
     if not items:
         return
 
-    # Absolute CRITICAL guardrail.
+    # Score each item once; the absolute CRITICAL guardrail is applied in the same pass.
+    non_critical: List[Tuple[int, T]] = []
     for item in items:
         score = int(get_score(item) or 0)
         if score >= 65:
             set_label(item, "CRITICAL")
         else:
-            set_label(item, "")
+            non_critical.append((score, item))
 
-    non_critical = [item for item in items if int(get_score(item) or 0) < 65]
     n = len(non_critical)
     if n == 0:
         return
 
     # Small sample fallback for stability.
     if n < 8:
-        for item in non_critical:
-            score = int(get_score(item) or 0)
+        for score, item in non_critical:
             if score >= 40:
                 set_label(item, "HIGH")
             elif score >= 20:
@@ -49,15 +49,13 @@ def apply_relative_risk_labels(
                 set_label(item, "LOW")
         return
 
-    sorted_items = sorted(
-        non_critical, key=lambda item: int(get_score(item) or 0), reverse=True
-    )
+    non_critical.sort(key=itemgetter(0), reverse=True)
     high_n = max(1, math.ceil(n * 0.15))
     medium_n = max(1, math.ceil(n * 0.25))
     if high_n + medium_n > n:
         medium_n = max(0, n - high_n)
 
-    for idx, item in enumerate(sorted_items):
+    for idx, (_, item) in enumerate(non_critical):
         if idx < high_n:
             set_label(item, "HIGH")
         elif idx < high_n + medium_n:
@@ -9,6 +9,19 @@ from typing import Dict, Any, List, Optional
 from config import CURRENT_WP_VERSION
 from models import CodeAnalysisResult
 
+USER_INPUT_TAGS = frozenset(
+    {
+        "form",
+        "contact",
+        "input",
+        "chat",
+        "comment",
+        "review",
+        "upload",
+        "profile",
+    }
+)
+
 
 def calculate_vps_score(
     plugin: Dict[str, Any],
@@ -120,17 +133,7 @@ def calculate_vps_score(
             evidence_count += 1
 
     # 8. User-facing bonus (small, to avoid over-scoring)
-    user_input_tags = {
-        "form",
-        "contact",
-        "input",
-        "chat",
-        "comment",
-        "review",
-        "upload",
-        "profile",
-    }
-    if any(tag in unique_tags for tag in user_input_tags):
+    if not USER_INPUT_TAGS.isdisjoint(unique_tags):
         score += 3
 
     # 9. Trust/maintenance reductions
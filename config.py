@@ -4,7 +4,7 @@ Temodar Agent Configuration and Constants
 All global constants, tag sets, and color definitions.
 """
 
-from typing import Final, Set
+from typing import FrozenSet, Final
 
 # --- VERSION & LIMITS ---
 CURRENT_WP_VERSION: Final[float] = 6.7
@@ -19,7 +19,9 @@ MAX_QUERY_LIMIT: Final[int] = 1000
 MAX_CATALOG_SESSION_LIMIT: Final[int] = 500
 
 # --- RISKY TAG SETS ---
-RISKY_TAGS: Set[str] = {
+# Immutable so the hot scan path can share them across threads and use C-level
+# set operations without defensive copies.
+RISKY_TAGS: Final[FrozenSet[str]] = frozenset({
     # E-commerce & Payment
     "ecommerce",
     "woocommerce",
@@ -96,9 +98,9 @@ RISKY_TAGS: Set[str] = {
     "meta",
     "field",
     "acf",
-}
+})
 
-USER_FACING_TAGS: Set[str] = {
+USER_FACING_TAGS: Final[FrozenSet[str]] = frozenset({
     "chat",
     "contact",
     "form",
@@ -140,9 +142,9 @@ USER_FACING_TAGS: Set[str] = {
     "gamification",
     "badge",
     "points",
-}
+})
 
-SECURITY_KEYWORDS: Set[str] = {
+SECURITY_KEYWORDS: Final[FrozenSet[str]] = frozenset({
     "xss",
     "sql",
     "injection",
@@ -171,9 +173,9 @@ SECURITY_KEYWORDS: Set[str] = {
     "validation",
     "security update",
     "security fix",
-}
+})
 
-FEATURE_KEYWORDS: Set[str] = {
+FEATURE_KEYWORDS: Final[FrozenSet[str]] = frozenset({
     "added",
     "new",
     "feature",
@@ -195,4 +197,4 @@ FEATURE_KEYWORDS: Set[str] = {
     "shortcode",
     "widget",
     "custom post type",
-}
+})
@@ -253,15 +253,21 @@ AI_SCHEMA_STATEMENTS = [
 ]
 
 INDEX_STATEMENTS = [
-    """
-    CREATE INDEX IF NOT EXISTS idx_results_session
-    ON scan_results(session_id)
-    """,
+    # idx_results_session_score also serves session_id-only lookups.
+    "DROP INDEX IF EXISTS idx_results_session",
     """
     CREATE INDEX IF NOT EXISTS idx_results_score
     ON scan_results(score DESC)
     """,
     """
+    CREATE INDEX IF NOT EXISTS idx_results_session_score
+    ON scan_results(session_id, score DESC)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_semgrep_scans_slug
+    ON semgrep_scans(slug, id)
+    """,
+    """
     CREATE INDEX IF NOT EXISTS idx_plugin_catalog_last_seen
     ON plugin_catalog(last_seen_at DESC)
     """,
@@ -4,6 +4,7 @@ Temodar Agent Database Repository
 CRUD operations for scan sessions and results.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -252,3 +253,12 @@ class ScanRepository(
             ),
         )
 
+
+@lru_cache(maxsize=1)
+def get_shared_repository() -> ScanRepository:
+    """Return the process-wide repository for the default database.
+
+    Constructing a ScanRepository runs the schema bootstrap, so the API
+    routers share one instance (and its session lookup cache).
+    """
+    return ScanRepository()
@@ -13,7 +13,7 @@ logger = logging.getLogger("temodar_agent.database.catalog")
 def _csv_field(value: Any) -> str:
     """Normalize list-or-string values for CSV-style storage."""
     if isinstance(value, list):
-        return ",".join(str(item) for item in value)
+        return ",".join(map(str, value))
     return str(value or "")
 
 
@@ -154,53 +154,75 @@ class SessionRepositoryMixin:
         if cursor.fetchone():
             result.is_duplicate = True
 
+    def _insert_result(
+        self,
+        cursor: Any,
+        session_id: int,
+        session_created_at: str,
+        result: PluginResult,
+    ) -> int:
+        """Insert one scan result row and refresh its catalog entry."""
+        self._mark_result_duplicate_if_needed(cursor, session_id, result)
+        code_analysis_json = _serialize_code_analysis(result)
+
+        cursor.execute(
+            """
+            INSERT INTO scan_results (
+                session_id, slug, name, version, score, installations,
+                days_since_update, tested_wp_version, author_trusted,
+                is_risky_category, is_user_facing, is_duplicate, is_theme, risk_tags, security_flags,
+                feature_flags, download_link, wp_org_link, cve_search_link, wpscan_link, trac_link, code_analysis_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                session_id,
+                result.slug,
+                result.name,
+                result.version,
+                result.score,
+                result.installations,
+                result.days_since_update,
+                result.tested_wp_version,
+                1 if result.author_trusted else 0,
+                1 if result.is_risky_category else 0,
+                1 if result.is_user_facing else 0,
+                1 if result.is_duplicate else 0,
+                1 if result.is_theme else 0,
+                ",".join(result.risk_tags),
+                ",".join(result.security_flags),
+                ",".join(result.feature_flags),
+                result.download_link,
+                result.wp_org_link,
+                result.cve_search_link,
+                result.wpscan_link,
+                result.trac_link,
+                code_analysis_json,
+            ),
+        )
+        inserted_id = cursor.lastrowid or 0
+        self._upsert_catalog_entry(cursor, session_id, session_created_at, result)
+        return inserted_id
+
     def save_result(self, session_id: int, result: PluginResult) -> int:
         """Save a scan result for a session."""
         with get_db(self.db_path) as conn:
             cursor = conn.cursor()
-            self._mark_result_duplicate_if_needed(cursor, session_id, result)
-            code_analysis_json = _serialize_code_analysis(result)
-
-            cursor.execute(
-                """
-                INSERT INTO scan_results (
-                    session_id, slug, name, version, score, installations,
-                    days_since_update, tested_wp_version, author_trusted,
-                    is_risky_category, is_user_facing, is_duplicate, is_theme, risk_tags, security_flags,
-                    feature_flags, download_link, wp_org_link, cve_search_link, wpscan_link, trac_link, code_analysis_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    session_id,
-                    result.slug,
-                    result.name,
-                    result.version,
-                    result.score,
-                    result.installations,
-                    result.days_since_update,
-                    result.tested_wp_version,
-                    1 if result.author_trusted else 0,
-                    1 if result.is_risky_category else 0,
-                    1 if result.is_user_facing else 0,
-                    1 if result.is_duplicate else 0,
-                    1 if result.is_theme else 0,
-                    ",".join(result.risk_tags),
-                    ",".join(result.security_flags),
-                    ",".join(result.feature_flags),
-                    result.download_link,
-                    result.wp_org_link,
-                    result.cve_search_link,
-                    result.wpscan_link,
-                    result.trac_link,
-                    code_analysis_json,
-                ),
-            )
-            inserted_id = cursor.lastrowid or 0
             session_created_at = self._get_session_created_at(cursor, session_id)
-            self._upsert_catalog_entry(cursor, session_id, session_created_at, result)
+            inserted_id = self._insert_result(cursor, session_id, session_created_at, result)
             conn.commit()
             return inserted_id
 
+    def save_results(self, session_id: int, results: List[PluginResult]) -> None:
+        """Save a batch of scan results for a session in a single transaction."""
+        if not results:
+            return
+        with get_db(self.db_path) as conn:
+            cursor = conn.cursor()
+            session_created_at = self._get_session_created_at(cursor, session_id)
+            for result in results:
+                self._insert_result(cursor, session_id, session_created_at, result)
+            conn.commit()
+
     def get_session(self, session_id: int) -> Optional[Dict[str, Any]]:
         """Get a scan session by ID."""
         with get_db(self.db_path) as conn:
@@ -382,6 +404,29 @@ class SessionRepositoryMixin:
             cursor.execute("SELECT slug FROM scan_results WHERE session_id = ?", (session_id,))
             return [str(row["slug"]) for row in cursor.fetchall()]
 
+    def have_same_result_slugs(self, session_id: int, other_session_id: int) -> bool:
+        """Return whether two sessions found exactly the same set of slugs.
+
+        The comparison runs inside SQLite so no slug lists are materialised.
+        """
+        with get_db(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT NOT EXISTS (
+                    SELECT slug FROM scan_results WHERE session_id = ?
+                    EXCEPT
+                    SELECT slug FROM scan_results WHERE session_id = ?
+                ) AND NOT EXISTS (
+                    SELECT slug FROM scan_results WHERE session_id = ?
+                    EXCEPT
+                    SELECT slug FROM scan_results WHERE session_id = ?
+                )
+            """,
+                (session_id, other_session_id, other_session_id, session_id),
+            )
+            return bool(cursor.fetchone()[0])
+
     def mark_session_merged(self, session_id: int) -> None:
         with get_db(self.db_path) as conn:
             cursor = conn.cursor()
@@ -13,6 +13,7 @@ import shutil
 import socket
 import ssl
 import zipfile
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
@@ -23,6 +24,12 @@ from runtime_paths import resolve_runtime_paths
 logger = logging.getLogger("temodar_agent.downloaders.plugin")
 
 
+@lru_cache(maxsize=1)
+def _default_tls_context() -> ssl.SSLContext:
+    """Build the verifying TLS context once; loading the CA store is not free."""
+    return ssl.create_default_context()
+
+
 class PluginDownloader:
     """Plugin downloader and extractor."""
 
@@ -32,6 +39,8 @@ class PluginDownloader:
     MAX_TOTAL_UNCOMPRESSED_SIZE = 300 * 1024 * 1024  # 300 MB total
     MAX_COMPRESSION_RATIO = 1000  # Basic zip-bomb heuristic
     MAX_ZIP_DOWNLOAD_SIZE = 200 * 1024 * 1024
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    DOWNLOAD_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB, avoids many small write() syscalls
 
     def __init__(self, base_dir: str | Path | None = None):
         runtime_plugins_dir = resolve_runtime_paths().plugins_dir
@@ -162,7 +171,7 @@ class PluginDownloader:
 
         class PinnedHTTPSConnection(http.client.HTTPSConnection):
             def __init__(self, pinned_addr: str, target_host: str, target_port: int, timeout: int):
-                context = ssl.create_default_context()
+                context = _default_tls_context()
                 super().__init__(host=target_host, port=target_port, timeout=timeout, context=context)
                 self._pinned_addr = pinned_addr
                 self._target_port = target_port
@@ -229,9 +238,11 @@ class PluginDownloader:
                     raise ValueError(f"HTTP {response.status}")
 
                 total_downloaded = 0
-                with open(zip_path, "wb") as file_handle:
+                with open(
+                    zip_path, "wb", buffering=self.DOWNLOAD_WRITE_BUFFER_SIZE
+                ) as file_handle:
                     while True:
-                        chunk = response.read(8192)
+                        chunk = response.read(self.DOWNLOAD_CHUNK_SIZE)
                         if not chunk:
                             break
                         total_downloaded += len(chunk)
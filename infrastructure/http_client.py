@@ -4,8 +4,9 @@ HTTP Client Infrastructure
 
 from __future__ import annotations
 
+import random
 import threading
-from typing import Optional
+from typing import Any, Optional
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -14,7 +15,8 @@ from urllib3.util.retry import Retry
 from config import MAX_POOL_SIZE
 
 DEFAULT_RETRY_ATTEMPTS = 3
-DEFAULT_BACKOFF_FACTOR = 0.5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_CAP_SECONDS = 60.0
 RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
 
 _session_lock = threading.Lock()
@@ -22,16 +24,45 @@ _session: Optional[requests.Session] = None
 _configured_pool_size = 0
 
 
+class DecorrelatedJitterRetry(Retry):
+    """Retry policy using decorrelated jittered exponential backoff.
+
+    Each delay is drawn from ``uniform(base, previous * 3)`` and capped, so
+    concurrent scanner threads throttled at the same moment spread their
+    retries out instead of hitting the API again in lockstep. A server
+    ``Retry-After`` header still takes precedence.
+    """
+
+    def __init__(self, *args: Any, previous_backoff: float = 0.0, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.previous_backoff = previous_backoff
+        self._backoff: Optional[float] = None
+
+    def new(self, **kw: Any) -> "DecorrelatedJitterRetry":
+        kw.setdefault("previous_backoff", self._backoff or self.previous_backoff)
+        return super().new(**kw)
+
+    def get_backoff_time(self) -> float:
+        if not self.history:
+            return 0.0
+        if self._backoff is None:
+            upper = max(BACKOFF_BASE_SECONDS, self.previous_backoff * 3)
+            # Capped with the module constant: Retry(backoff_max=...) only
+            # exists in urllib3 2.x, and requests still accepts urllib3 1.26.
+            self._backoff = min(BACKOFF_CAP_SECONDS, random.uniform(BACKOFF_BASE_SECONDS, upper))
+        return self._backoff
+
+
 def _build_retry_strategy() -> Retry:
     """Create a conservative retry strategy for transient HTTP failures."""
-    return Retry(
+    return DecorrelatedJitterRetry(
         total=DEFAULT_RETRY_ATTEMPTS,
         connect=DEFAULT_RETRY_ATTEMPTS,
         read=DEFAULT_RETRY_ATTEMPTS,
         status=DEFAULT_RETRY_ATTEMPTS,
-        backoff_factor=DEFAULT_BACKOFF_FACTOR,
         status_forcelist=RETRYABLE_STATUS_CODES,
         allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+        respect_retry_after_header=True,
         raise_on_status=False,
     )
 
@@ -61,6 +92,13 @@ def get_session(pool_size: int = MAX_POOL_SIZE) -> requests.Session:
     global _session, _configured_pool_size
 
     safe_pool_size = min(max(pool_size, 1), MAX_POOL_SIZE)
+    # Fast path for scanner worker threads: once the shared session exists with
+    # a large enough pool, reading it needs no lock. Creation and upgrades below
+    # still serialise on ``_session_lock``.
+    session = _session
+    if session is not None and safe_pool_size <= _configured_pool_size:
+        return session
+
     with _session_lock:
         if _session is None:
             _session = requests.Session()
@@ -0,0 +1,29 @@
+"""
+JSON Codec Infrastructure
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional wheel
+    orjson = None
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    """Decode a JSON document, preferring raw bytes to skip a text decode step."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode a JSON document to compact UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
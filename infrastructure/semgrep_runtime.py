@@ -1,3 +1,4 @@
+import importlib.util
 import shutil
 import subprocess
 import sys
@@ -25,10 +26,14 @@ def get_semgrep_command() -> Optional[List[str]]:
     project_root = Path(__file__).resolve().parents[1]
     venv_semgrep = project_root / ".venv" / "bin" / "semgrep"
 
-    candidates = [
-        ["semgrep"],
-        [sys.executable, "-m", "semgrep"],
-    ]
+    # Probe only candidates that can exist: a bare "semgrep" needs a PATH hit
+    # and "-m semgrep" needs an importable module. Each probe is a fork+exec,
+    # and "-m" also pays a full interpreter start-up.
+    candidates: List[List[str]] = []
+    if semgrep_on_path:
+        candidates.append(["semgrep"])
+    if importlib.util.find_spec("semgrep") is not None:
+        candidates.append([sys.executable, "-m", "semgrep"])
 
     if semgrep_on_path:
         candidates.append([semgrep_on_path])
@@ -74,9 +74,13 @@ class ScanConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginResult:
-    """Structured result for a scanned plugin."""
+    """Structured result for a scanned plugin.
+
+    Slotted because scans can hold thousands of these; fields stay mutable since
+    risk labels and duplicate flags are assigned after construction.
+    """
 
     # Basic info
     name: str
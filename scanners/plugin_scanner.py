@@ -6,10 +6,12 @@ Plugin fetching and analysis from WordPress.org API.
 
 from __future__ import annotations
 
+import math
 import threading
-import time
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, Optional
+from urllib.parse import quote
 
 import requests
 
@@ -21,31 +23,41 @@ from config import (
     SECURITY_KEYWORDS,
     USER_FACING_TAGS,
 )
+from infrastructure import json_codec
 from infrastructure.http_client import get_session
 from logger import setup_logger
 from models import PluginResult, ScanConfig
-from utils.date_utils import calculate_days_ago
+from utils.date_utils import calculate_days_ago, today_ordinal
 
 logger = setup_logger(__name__)
 
 WORDPRESS_PLUGIN_API_URL = "https://api.wordpress.org/plugins/info/1.2/"
 WORDPRESS_PLUGIN_PAGE_SIZE = 100
-DEFAULT_FETCH_RETRIES = 3
+WORDPRESS_PLUGIN_PAGE_BASE_URL = "https://wordpress.org/plugins/"
+CVE_SEARCH_BASE_URL = "https://cve.mitre.org/cgi-bin/cvekey.cgi?keyword="
+WPSCAN_PLUGIN_BASE_URL = "https://wpscan.com/plugin/"
+PLUGIN_TRAC_LOG_BASE_URL = "https://plugins.trac.wordpress.org/log/"
 FETCH_TIMEOUT_SECONDS = 30
-RATE_LIMIT_BACKOFF_SECONDS = 5
-NETWORK_RETRY_DELAY_SECONDS = 2
 AGGRESSIVE_SCAN_THREADS = 50
 DEFAULT_SCAN_THREADS = 5
 TRUSTED_AUTHOR_KEYWORDS = ("automattic", "wordpress.org")
+CHANGELOG_SCAN_CHARS = 2000
+ABANDONED_MIN_DAYS = 730
+CHANGELOG_FETCH_THREADS = 8
+# Changelog lookups for plugins that pass the filters share one bounded pool
+# across pages and scans, capping concurrent per-plugin API requests.
+CHANGELOG_EXECUTOR = ThreadPoolExecutor(
+    max_workers=CHANGELOG_FETCH_THREADS, thread_name_prefix="changelog"
+)
 
 
 def analyze_changelog(sections: Dict[str, str]) -> tuple[list[str], list[str]]:
     """Analyze changelog text for security and feature keywords."""
-    changelog = str(sections.get("changelog", "") or "").lower()
-    if not changelog:
+    # Only the most recent entries matter; lowercase just that slice, not the whole log.
+    recent_log = str(sections.get("changelog", "") or "")[:CHANGELOG_SCAN_CHARS].lower()
+    if not recent_log:
         return [], []
 
-    recent_log = changelog[:2000]
     found_security = [keyword for keyword in SECURITY_KEYWORDS if keyword in recent_log]
     found_features = [keyword for keyword in FEATURE_KEYWORDS if keyword in recent_log]
     return found_security, found_features
@@ -70,87 +82,133 @@ def _plugin_query_params(page: int, browse_type: str) -> Dict[str, Any]:
         "request[fields][author]": True,
         "request[fields][version]": True,
         "request[fields][tags]": True,
-        "request[fields][sections]": True,
+        # Full readme sections are large; changelogs are fetched per surviving plugin.
+        "request[fields][sections]": False,
         "request[fields][donate_link]": True,
     }
 
 
-def _handle_rate_limit(attempt: int) -> None:
-    """Pause after WordPress API rate limiting."""
-    wait_time = RATE_LIMIT_BACKOFF_SECONDS * (attempt + 1)
-    logger.error("Rate limited, waiting %ss...", wait_time)
-    time.sleep(wait_time)
-
+def _plugin_changelog_params(slug: str) -> Dict[str, Any]:
+    """Build a plugin_information payload that keeps only readme sections."""
+    return {
+        "action": "plugin_information",
+        "request[slug]": slug,
+        "request[fields][sections]": True,
+        "request[fields][versions]": False,
+        "request[fields][screenshots]": False,
+        "request[fields][reviews]": False,
+        "request[fields][banners]": False,
+        "request[fields][icons]": False,
+        "request[fields][contributors]": False,
+        "request[fields][ratings]": False,
+        "request[fields][tags]": False,
+    }
 
-def _handle_network_retry(error: Exception) -> None:
-    """Pause after transient network failures."""
-    logger.error("Network error (%s), retrying...", error)
-    time.sleep(NETWORK_RETRY_DELAY_SECONDS)
 
+def fetch_plugins(page: int, browse_type: str) -> list[Dict[str, Any]]:
+    """Fetch one page of plugins from the WP API.
 
-def fetch_plugins(
-    page: int,
-    browse_type: str,
-    max_retries: int = DEFAULT_FETCH_RETRIES,
-) -> list[Dict[str, Any]]:
-    """Fetch plugins from WP API with retry logic."""
+    Rate limits, transient 5xx responses and connection failures are retried with
+    backoff by the shared session's transport adapter, so no retry loop lives here.
+    """
     session = get_session()
     params = _plugin_query_params(page, browse_type)
 
-    for attempt in range(max_retries):
-        try:
-            response = session.get(
-                WORDPRESS_PLUGIN_API_URL,
-                params=params,
-                timeout=FETCH_TIMEOUT_SECONDS,
-            )
-        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
-            _handle_network_retry(exc)
-            continue
-        except Exception as exc:
-            logger.error("Unexpected API Error: %s", exc)
-            break
-
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("plugins", []) if data else []
-
-        if response.status_code == 429:
-            _handle_rate_limit(attempt)
-            continue
+    try:
+        response = session.get(
+            WORDPRESS_PLUGIN_API_URL,
+            params=params,
+            timeout=FETCH_TIMEOUT_SECONDS,
+        )
+    except requests.exceptions.RequestException as exc:
+        logger.error("Plugin API request failed after retries (%s)", exc)
+        return []
+    except Exception as exc:
+        logger.error("Unexpected API Error: %s", exc)
+        return []
+
+    if response.status_code == 200:
+        data = json_codec.loads(response.content)
+        return data.get("plugins", []) if data else []
+
+    logger.warning(
+        "Plugin API request returned non-success status",
+        extra={"status_code": response.status_code, "page": page, "browse_type": browse_type},
+    )
+    return []
+
+
+def fetch_plugin_sections(slug: str) -> Dict[str, str]:
+    """Fetch readme sections (including the changelog) for a single plugin."""
+    if not slug:
+        return {}
+
+    try:
+        response = get_session().get(
+            WORDPRESS_PLUGIN_API_URL,
+            params=_plugin_changelog_params(slug),
+            timeout=FETCH_TIMEOUT_SECONDS,
+        )
+    except requests.exceptions.RequestException as exc:
+        logger.warning("Plugin changelog request failed for %s (%s)", slug, exc)
+        return {}
 
+    # An empty result drops every changelog security flag, so failures are
+    # logged to keep a throttled request distinguishable from a clean history.
+    if response.status_code != 200:
         logger.warning(
-            "Plugin API request returned non-success status",
-            extra={"status_code": response.status_code, "page": page, "browse_type": browse_type},
+            "Plugin changelog request for %s returned status %s",
+            slug,
+            response.status_code,
         )
-        break
+        return {}
+    try:
+        data = json_codec.loads(response.content)
+    except ValueError as exc:
+        logger.warning("Plugin changelog response for %s is not valid JSON (%s)", slug, exc)
+        return {}
+    sections = data.get("sections") if isinstance(data, dict) else None
+    return sections if isinstance(sections, dict) else {}
 
-    return []
+
+def _tag_haystack(name: str, description: str) -> str:
+    """Join lowercased name and description for substring tag matching.
+
+    Tags never contain newlines, so a match cannot straddle the separator.
+    """
+    return f"{name}\n{description}"
 
 
 def _matches_any_tag(
-    candidates: set[str],
-    plugin_tags: list[str],
-    name: str,
-    description: str,
+    candidates: frozenset[str],
+    plugin_tags: set[str],
+    haystack: str,
 ) -> list[str]:
-    """Find matching tags across plugin tags, name, and description."""
-    return [
-        tag for tag in candidates if tag in plugin_tags or tag in name or tag in description
-    ]
+    """Find matching tags across plugin tags and the name/description haystack."""
+    return [tag for tag in candidates if tag in plugin_tags or tag in haystack]
+
+
+def _has_any_tag(
+    candidates: frozenset[str],
+    plugin_tags: set[str],
+    haystack: str,
+) -> bool:
+    """Return whether any candidate tag matches, stopping at the first hit."""
+    return not candidates.isdisjoint(plugin_tags) or any(
+        tag in haystack for tag in candidates
+    )
 
 
 def _resolve_user_facing(
     config: ScanConfig,
-    plugin_tags: list[str],
-    name: str,
-    description: str,
+    plugin_tags: set[str],
+    haystack: str,
 ) -> tuple[bool, bool]:
     """Resolve user-facing filter pass state and final flag."""
-    user_facing_match = _matches_any_tag(USER_FACING_TAGS, plugin_tags, name, description)
-    if config.user_facing and not user_facing_match:
+    is_user_facing = _has_any_tag(USER_FACING_TAGS, plugin_tags, haystack)
+    if config.user_facing and not is_user_facing:
         return False, False
-    return True, bool(user_facing_match)
+    return True, is_user_facing
 
 
 def _support_resolution_rate(plugin: Dict[str, Any]) -> int:
@@ -183,6 +241,8 @@ def _build_plugin_result(
     is_trusted: bool,
 ) -> PluginResult:
     """Build the normalized PluginResult DTO."""
+    # Slugs come from the API; escape once so an odd value cannot break the links.
+    url_slug = quote(slug, safe="")
     return PluginResult(
         name=plugin.get("name", "Unknown"),
         slug=slug,
@@ -199,13 +259,47 @@ def _build_plugin_result(
         security_flags=sec_flags,
         feature_flags=feat_flags,
         download_link=plugin.get("download_link", ""),
-        wp_org_link=f"https://wordpress.org/plugins/{slug}/",
-        cve_search_link=f"https://cve.mitre.org/cgi-bin/cvekey.cgi?keyword={slug}",
-        wpscan_link=f"https://wpscan.com/plugin/{slug}",
-        trac_link=f"https://plugins.trac.wordpress.org/log/{slug}/",
+        wp_org_link=f"{WORDPRESS_PLUGIN_PAGE_BASE_URL}{url_slug}/",
+        cve_search_link=f"{CVE_SEARCH_BASE_URL}{url_slug}",
+        wpscan_link=f"{WPSCAN_PLUGIN_BASE_URL}{url_slug}",
+        trac_link=f"{PLUGIN_TRAC_LOG_BASE_URL}{url_slug}/",
     )
 
 
+@dataclass(frozen=True)
+class _ScreenedPlugin:
+    """A plugin that passed every filter, awaiting changelog analysis."""
+
+    plugin: Dict[str, Any]
+    slug: str
+    installs: int
+    days_ago: int
+    matched_tags: list[str]
+    is_user_facing: bool
+
+
+@dataclass(frozen=True)
+class _FilterThresholds:
+    """Inclusive filter bounds resolved once per scan from ScanConfig."""
+
+    min_installs: float
+    max_installs: float
+    min_days: float
+    max_days: float
+
+    @classmethod
+    def from_config(cls, config: ScanConfig) -> "_FilterThresholds":
+        min_days: float = config.min_days if config.min_days > 0 else -math.inf
+        if config.abandoned:
+            min_days = max(min_days, ABANDONED_MIN_DAYS)
+        return cls(
+            min_installs=config.min_installs,
+            max_installs=config.max_installs if config.max_installs > 0 else math.inf,
+            min_days=min_days,
+            max_days=config.max_days if config.max_days > 0 else math.inf,
+        )
+
+
 class PluginScanner:
     """High-level plugin scanner with configurable callbacks."""
 
@@ -216,11 +310,13 @@ class PluginScanner:
         on_progress: Optional[Callable[[int, int], None]] = None,
     ):
         self.config = config
+        self._thresholds = _FilterThresholds.from_config(config)
         self.on_result = on_result
         self.on_progress = on_progress
         self.results: list[PluginResult] = []
         self.found_count = 0
         self.stop_event = threading.Event()
+        self._limit_hit = threading.Event()
         self._results_lock = threading.Lock()
 
     def stop(self) -> None:
@@ -228,72 +324,109 @@ class PluginScanner:
         self.stop_event.set()
 
     def _limit_reached(self) -> bool:
-        with self._results_lock:
-            return self.config.limit > 0 and self.found_count >= self.config.limit
+        return self._limit_hit.is_set()
 
     def _should_stop(self) -> bool:
-        return self.stop_event.is_set() or self._limit_reached()
+        return self.stop_event.is_set() or self._limit_hit.is_set()
 
     def _store_result(self, result: PluginResult) -> bool:
+        """Record a result; the count and limit latch change together under the lock."""
         with self._results_lock:
-            if self.config.limit > 0 and self.found_count >= self.config.limit:
+            if self._limit_hit.is_set():
                 return False
             self.found_count += 1
             self.results.append(result)
+            if self.config.limit > 0 and self.found_count >= self.config.limit:
+                self._limit_hit.set()
             return True
 
     def _passes_install_filters(self, installs: int) -> bool:
         """Check install-count filters."""
-        if installs < self.config.min_installs:
-            return False
-        if self.config.max_installs > 0 and installs > self.config.max_installs:
-            return False
-        return True
+        thresholds = self._thresholds
+        return thresholds.min_installs <= installs <= thresholds.max_installs
 
     def _passes_update_age_filters(self, days_ago: int) -> bool:
         """Check update-age and abandoned filters."""
-        if self.config.min_days > 0 and days_ago < self.config.min_days:
-            return False
-        if self.config.max_days > 0 and days_ago > self.config.max_days:
-            return False
-        if self.config.abandoned and days_ago < 730:
-            return False
-        return True
-
-    def process_plugin(self, plugin: Dict[str, Any]) -> Optional[PluginResult]:
-        """Process a single plugin and return a PluginResult if it passes filters."""
-        installs = int(plugin.get("active_installs", 0) or 0)
+        thresholds = self._thresholds
+        return thresholds.min_days <= days_ago <= thresholds.max_days
+
+    def process_plugin(
+        self, plugin: Dict[str, Any], today: Optional[int] = None
+    ) -> Optional[PluginResult]:
+        """Process a single plugin and return a PluginResult if it passes filters.
+
+        ``today`` is an optional precomputed ``today_ordinal()`` shared by a page.
+        """
+        screened = self._screen_plugin(plugin, today)
+        if screened is None:
+            return None
+        sections = self._plugin_sections(screened)
+        if sections is None:
+            return None
+        return self._score_plugin(screened, sections)
+
+    def _screen_plugin(
+        self, plugin: Dict[str, Any], today: Optional[int] = None
+    ) -> Optional[_ScreenedPlugin]:
+        """Apply every listing-only filter; no request is made here."""
+        get = plugin.get
+        installs = int(get("active_installs", 0) or 0)
         if not self._passes_install_filters(installs):
             return None
 
-        days_ago = calculate_days_ago(plugin.get("last_updated"))
+        days_ago = calculate_days_ago(get("last_updated"), today)
         if not self._passes_update_age_filters(days_ago):
             return None
 
-        plugin_tags = list((plugin.get("tags") or {}).keys())
-        name = str(plugin.get("name", "") or "").lower()
-        description = str(plugin.get("short_description", "") or "").lower()
-        matched_tags = _matches_any_tag(RISKY_TAGS, plugin_tags, name, description)
-        if self.config.smart and not matched_tags:
-            return None
-
+        plugin_tags = set(get("tags") or {})
+        haystack = _tag_haystack(
+            str(get("name", "") or "").lower(),
+            str(get("short_description", "") or "").lower(),
+        )
+        # The user-facing check stops at its first hit, so it runs before the
+        # full risky-tag scan; the changelog request only happens after both.
         user_facing_passed, is_user_facing = _resolve_user_facing(
             self.config,
             plugin_tags,
-            name,
-            description,
+            haystack,
         )
         if not user_facing_passed:
             return None
 
-        sec_flags, feat_flags = analyze_changelog(plugin.get("sections", {}))
+        matched_tags = _matches_any_tag(RISKY_TAGS, plugin_tags, haystack)
+        if self.config.smart and not matched_tags:
+            return None
+
+        return _ScreenedPlugin(
+            plugin=plugin,
+            slug=str(get("slug", "") or ""),
+            installs=installs,
+            days_ago=days_ago,
+            matched_tags=matched_tags,
+            is_user_facing=is_user_facing,
+        )
+
+    def _plugin_sections(self, screened: _ScreenedPlugin) -> Optional[Dict[str, str]]:
+        """Return readme sections, or None when the scan stopped before fetching."""
+        sections = screened.plugin.get("sections")
+        if sections is not None:
+            return sections
+        if self._should_stop():
+            return None
+        return fetch_plugin_sections(screened.slug)
+
+    def _score_plugin(
+        self, screened: _ScreenedPlugin, sections: Dict[str, str]
+    ) -> PluginResult:
+        """Score a screened plugin using its changelog sections."""
+        plugin = screened.plugin
+        sec_flags, feat_flags = analyze_changelog(sections)
         tested_ver = str(plugin.get("tested", "?") or "?")
-        slug = str(plugin.get("slug", "") or "")
         author_raw = str(plugin.get("author", "Unknown") or "Unknown")
         vps_score = calculate_vps_score(
             plugin,
-            days_ago,
-            matched_tags,
+            screened.days_ago,
+            screened.matched_tags,
             _support_resolution_rate(plugin),
             tested_ver,
             sec_flags,
@@ -302,38 +435,57 @@ class PluginScanner:
 
         return _build_plugin_result(
             plugin=plugin,
-            slug=slug,
-            installs=installs,
-            days_ago=days_ago,
+            slug=screened.slug,
+            installs=screened.installs,
+            days_ago=screened.days_ago,
             tested_ver=tested_ver,
-            matched_tags=matched_tags,
+            matched_tags=screened.matched_tags,
             sec_flags=sec_flags,
             feat_flags=feat_flags,
             vps_score=vps_score,
-            is_user_facing=is_user_facing,
+            is_user_facing=screened.is_user_facing,
             is_trusted=_is_trusted_author(author_raw),
         )
 
+    def _changelog_chunk_size(self) -> int:
+        """Fetch no more changelogs at once than the result limit can still use."""
+        if self.config.limit <= 0:
+            return CHANGELOG_FETCH_THREADS
+        remaining = self.config.limit - self.found_count
+        return max(1, min(CHANGELOG_FETCH_THREADS, remaining))
+
     def scan_page(self, page: int) -> list[PluginResult]:
-        """Scan a single page of plugins."""
+        """Scan a single page of plugins.
+
+        Listing filters run first; changelogs for the survivors are then fetched
+        in small concurrent chunks, and results are stored in listing order.
+        """
         if self._should_stop():
             return []
 
         plugins = fetch_plugins(page, self.config.sort)
+        today = today_ordinal()
+        screened = [
+            candidate
+            for candidate in (self._screen_plugin(plugin, today) for plugin in plugins)
+            if candidate is not None
+        ]
         page_results: list[PluginResult] = []
-        for plugin in plugins:
-            if self._should_stop():
-                break
-
-            result = self.process_plugin(plugin)
-            if result is None:
-                continue
-            if not self._store_result(result):
-                break
-
-            page_results.append(result)
-            if self.on_result:
-                self.on_result(result)
+        start = 0
+        while start < len(screened) and not self._should_stop():
+            chunk = screened[start:start + self._changelog_chunk_size()]
+            start += len(chunk)
+            sections_list = list(CHANGELOG_EXECUTOR.map(self._plugin_sections, chunk))
+            for candidate, sections in zip(chunk, sections_list):
+                if sections is None or self._should_stop():
+                    return page_results
+                result = self._score_plugin(candidate, sections)
+                if not self._store_result(result):
+                    return page_results
+
+                page_results.append(result)
+                if self.on_result:
+                    self.on_result(result)
         return page_results
 
     def _notify_progress(self, current: int, total: int) -> None:
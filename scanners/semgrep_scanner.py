@@ -1,16 +1,19 @@
 # Semgrep security scanner for WordPress plugins
 
 import json
+import os
 import re
 import subprocess
 import tempfile
 import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+from infrastructure import json_codec
 from infrastructure.semgrep_runtime import get_semgrep_command, semgrep_install_hint
 from runtime_paths import resolve_runtime_paths
 
@@ -63,13 +66,51 @@ SEMGREP_COMMUNITY_SOURCES = [
 
 RUNTIME_PATHS = resolve_runtime_paths()
 SEMGREP_TIMEOUT_SECONDS = 3600
+# How often a running scan checks for a stop request.
+STOP_POLL_INTERVAL_SECONDS = 1.0
+# Skip Semgrep's per-run "latest version" request to semgrep.dev on startup.
+SEMGREP_STARTUP_ARGS = ("--disable-version-check",)
+# Per-file memory ceiling (MiB) so one pathological file is skipped with an
+# error instead of exhausting the host. Semgrep's own defaults already cap
+# target size (1 MB) and per-rule time (5s, 3 strikes per file).
+SEMGREP_MAX_MEMORY_MB = 2048
+# Upper bound on Semgrep processes running at once (the task service sizes its
+# worker pool from this); each process gets an equal share of the CPUs.
+SEMGREP_MAX_CONCURRENT_SCANS = 4
+# Build artefacts Semgrep should never walk, even if a plugin ships its own
+# .semgrepignore that would replace Semgrep's defaults. PHP under vendor/ is
+# kept on purpose: it is shipped, reachable code.
+SEMGREP_EXCLUDE_PATTERNS = ("node_modules", "*.min.js", "*.min.css", "*.map")
+# Enforce a stderr size cap to prevent memory exhaustion.
+MAX_STDERR_CHARS = 10 * 1024 * 1024
 SAFE_SLUG_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
-DANGEROUS_PATH_CHARS = [";", "&", "|", "`", "$", "(", ")", "<", ">", "\n", "\r"]
+DANGEROUS_PATH_CHARS_PATTERN = re.compile(r"[;&|`$()<>\n\r]")
 LEGACY_SEMGREP_RESULTS_DIR = Path("./semgrep_results")
 LEGACY_PACKAGE_SEMGREP_RESULTS_DIR = Path(__file__).resolve().parents[1] / "semgrep_results"
 SHARED_DISABLED_CONFIG_PATH = RUNTIME_PATHS.semgrep_dir / "disabled_config.json"
 CANONICAL_CUSTOM_RULES_PATH = RUNTIME_PATHS.semgrep_dir / "custom_rules.yaml"
 DEFAULT_SEMGREP_OUTPUT_DIR = RUNTIME_PATHS.semgrep_outputs_dir
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with them.
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_SAFE_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# ``semgrep --validate`` costs a process start per rule; remember verdicts per
+# (command, rule YAML) so repeated scans with unchanged rules skip it.
+_rule_validation_cache: Dict[tuple[tuple[str, ...], str], bool] = {}
+_rule_validation_lock = threading.Lock()
+
+
+def _available_cpu_count() -> int:
+    """Return the CPUs this process may run on (container/cpuset aware)."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return max(1, os.cpu_count() or 1)
+
+
+def _semgrep_job_count() -> int:
+    """Split the available CPUs across concurrent Semgrep processes."""
+    return max(1, _available_cpu_count() // SEMGREP_MAX_CONCURRENT_SCANS)
 
 
 @dataclass
@@ -173,21 +214,36 @@ class SemgrepScanner:
         if not self.semgrep_command:
             return True
 
+        try:
+            rule_yaml = yaml.dump(
+                {"rules": [rule]},
+                Dumper=YAML_SAFE_DUMPER,
+                default_flow_style=False,
+                sort_keys=False,
+            )
+        except Exception:
+            return False
+
+        cache_key = (tuple(self.semgrep_command), rule_yaml)
+        with _rule_validation_lock:
+            cached = _rule_validation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         temp_path = None
         try:
             with tempfile.NamedTemporaryFile(
                 mode="w", suffix=".yaml", delete=False, encoding="utf-8"
             ) as tmp:
-                yaml.dump({"rules": [rule]}, tmp, default_flow_style=False, sort_keys=False)
+                tmp.write(rule_yaml)
                 temp_path = tmp.name
 
             result = subprocess.run(
-                [*self.semgrep_command, "--validate", "--config", temp_path],
+                [*self.semgrep_command, *SEMGREP_STARTUP_ARGS, "--validate", "--config", temp_path],
                 capture_output=True,
                 text=True,
                 timeout=15,
             )
-            return result.returncode == 0
         except Exception:
             return False
         finally:
@@ -197,8 +253,22 @@ class SemgrepScanner:
                 except Exception:
                     pass
 
-    def _write_filtered_custom_rules(self, rules_data: Dict[str, Any], disabled_ids: set[str]) -> Optional[str]:
-        """Persist a filtered custom rules file with disabled or invalid rules removed."""
+        is_valid = result.returncode == 0
+        with _rule_validation_lock:
+            _rule_validation_cache[cache_key] = is_valid
+        return is_valid
+
+    def _write_filtered_custom_rules(
+        self,
+        rules_data: Dict[str, Any],
+        disabled_ids: set[str],
+        source_file: Path,
+    ) -> Optional[str]:
+        """Persist a filtered custom rules file with disabled or invalid rules removed.
+
+        When nothing is filtered out, ``source_file`` is returned as-is instead of
+        re-serialising an identical copy.
+        """
         rules = rules_data.get("rules", [])
         if not isinstance(rules, list):
             return None
@@ -223,12 +293,15 @@ class SemgrepScanner:
 
         if not active_rules:
             return None
+        if len(active_rules) == len(rules):
+            return str(source_file)
 
         filtered_file = self.output_dir / "active_custom_rules.yaml"
         with open(filtered_file, "w") as file_handle:
             yaml.dump(
                 {"rules": active_rules},
                 file_handle,
+                Dumper=YAML_SAFE_DUMPER,
                 default_flow_style=False,
                 sort_keys=False,
             )
@@ -243,9 +316,9 @@ class SemgrepScanner:
         disabled_ids = self._load_disabled_rule_ids()
         try:
             with open(custom_file, "r") as file_handle:
-                rules_data = yaml.safe_load(file_handle)
+                rules_data = yaml.load(file_handle, Loader=YAML_SAFE_LOADER)
             if rules_data and "rules" in rules_data:
-                return self._write_filtered_custom_rules(rules_data, disabled_ids)
+                return self._write_filtered_custom_rules(rules_data, disabled_ids, custom_file)
         except Exception:
             return str(custom_file)
 
@@ -282,7 +355,7 @@ class SemgrepScanner:
         if not slug or not isinstance(slug, str):
             return self._result(slug or "unknown", errors=["Invalid slug"])
 
-        if not SAFE_SLUG_PATTERN.match(slug):
+        if not SAFE_SLUG_PATTERN.fullmatch(slug):
             return self._result(slug, errors=["Invalid slug format"])
 
         path_obj = Path(plugin_path)
@@ -294,7 +367,7 @@ class SemgrepScanner:
         try:
             resolved_path = path_obj.resolve()
             plugin_target_path = str(resolved_path)
-            if any(char in plugin_target_path for char in DANGEROUS_PATH_CHARS):
+            if DANGEROUS_PATH_CHARS_PATTERN.search(plugin_target_path):
                 return self._result(slug, errors=["Invalid characters in path"])
         except Exception as exc:
             return self._result(slug, errors=[f"Path validation error: {str(exc)}"])
@@ -307,8 +380,12 @@ class SemgrepScanner:
 
     def _build_scan_command(self, target: SemgrepTarget) -> List[str]:
         """Build the full semgrep subprocess command."""
-        command = list(self.semgrep_command or [])
+        command = [*(self.semgrep_command or []), *SEMGREP_STARTUP_ARGS]
         command.extend(self._get_config_args())
+        command.extend(["--max-memory", str(SEMGREP_MAX_MEMORY_MB)])
+        command.extend(["--jobs", str(_semgrep_job_count())])
+        for pattern in SEMGREP_EXCLUDE_PATTERNS:
+            command.extend(["--exclude", pattern])
         command.extend(
             [
                 "--json",
@@ -331,15 +408,17 @@ class SemgrepScanner:
             "was unexpected",
             "timeout when running",
             "timed out while running",
+            "out of memory",
+            "outofmemory",
         ]
         return any(marker in normalized for marker in non_fatal_markers)
 
     def _parse_output_file(self, output_file: Path, stderr: str) -> SemgrepExecutionResult:
         """Parse semgrep JSON output file."""
         try:
-            with open(output_file, "r") as file_handle:
-                data = json.load(file_handle)
-        except json.JSONDecodeError:
+            # Decode the raw bytes so orjson, when installed, skips the text layer.
+            data = json_codec.loads(output_file.read_bytes())
+        except ValueError:
             return SemgrepExecutionResult(
                 findings=[],
                 errors=[f"Invalid JSON output from Semgrep. Stderr: {stderr}"],
@@ -437,42 +516,53 @@ class SemgrepScanner:
         target.output_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Use Popen for cooperative cancellation support and resource limits.
+        # Results go to ``--output``; stdout carries nothing we read, so it is
+        # discarded instead of being piped and decoded alongside the report.
         process = subprocess.Popen(
             self._build_scan_command(target),
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
         )
-        # Enforce output size cap to prevent memory exhaustion.
-        MAX_OUTPUT_SIZE = 10 * 1024 * 1024  # 10 MB
-        try:
-            if SEMGREP_TIMEOUT_SECONDS is None:
-                stdout, stderr = process.communicate()
-            else:
-                stdout, stderr = process.communicate(timeout=SEMGREP_TIMEOUT_SECONDS)
-            if len(stdout) > MAX_OUTPUT_SIZE:
-                stdout = stdout[:MAX_OUTPUT_SIZE]
-            if len(stderr) > MAX_OUTPUT_SIZE:
-                stderr = stderr[:MAX_OUTPUT_SIZE]
-        except subprocess.TimeoutExpired:
-            process.kill()
-            stdout, stderr = process.communicate()
-            if len(stdout) > MAX_OUTPUT_SIZE:
-                stdout = stdout[:MAX_OUTPUT_SIZE]
-            if len(stderr) > MAX_OUTPUT_SIZE:
-                stderr = stderr[:MAX_OUTPUT_SIZE]
-            return self._parse_subprocess_result(
-                output_file=target.output_file,
-                returncode=process.returncode,
-                stderr=stderr,
-                timed_out=True,
-            )
+        stderr, outcome = self._wait_for_process(process)
+        if outcome == "stopped":
+            return SemgrepExecutionResult(findings=[], errors=["Stopped"], success=False)
 
         return self._parse_subprocess_result(
             output_file=target.output_file,
             returncode=process.returncode,
-            stderr=stderr,
+            stderr=stderr[:MAX_STDERR_CHARS],
+            timed_out=outcome == "timeout",
+        )
+
+    def _wait_for_process(self, process: subprocess.Popen) -> tuple[str, str]:
+        """Wait for Semgrep, polling ``stop_event`` and the overall timeout.
+
+        Returns the captured stderr and one of ``"done"``, ``"stopped"`` or
+        ``"timeout"``.
+        """
+        deadline = (
+            None
+            if SEMGREP_TIMEOUT_SECONDS is None
+            else time.monotonic() + SEMGREP_TIMEOUT_SECONDS
         )
+        while True:
+            wait_seconds = STOP_POLL_INTERVAL_SECONDS
+            if deadline is not None:
+                wait_seconds = max(0.0, min(wait_seconds, deadline - time.monotonic()))
+            try:
+                _, stderr = process.communicate(timeout=wait_seconds)
+                return stderr or "", "done"
+            except subprocess.TimeoutExpired:
+                if self.stop_event.is_set():
+                    outcome = "stopped"
+                elif deadline is not None and time.monotonic() >= deadline:
+                    outcome = "timeout"
+                else:
+                    continue
+            process.kill()
+            _, stderr = process.communicate()
+            return stderr or "", outcome
 
     def scan_plugin(self, plugin_path: str, slug: str) -> SemgrepResult:
         target = self._validate_scan_target(plugin_path, slug)
@@ -5,15 +5,29 @@ Theme fetching and analysis from WordPress.org API.
 """
 
 import logging
-import time
 import threading
-from typing import List, Dict, Any, Optional, Callable
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Deque, Tuple
+from urllib.parse import quote
 from config import RISKY_TAGS
+from infrastructure import json_codec
 from infrastructure.http_client import get_session
-from utils.date_utils import calculate_days_ago
+from utils.date_utils import calculate_days_ago, today_ordinal
 
 logger = logging.getLogger("temodar_agent.scanners.theme")
 
+WORDPRESS_THEME_API_URL = "https://api.wordpress.org/themes/info/1.2/"
+WORDPRESS_THEME_PAGE_SIZE = 100
+WORDPRESS_THEME_PAGE_BASE_URL = "https://wordpress.org/themes/"
+THEME_TRAC_LOG_BASE_URL = "https://themes.trac.wordpress.org/log/"
+WPSCAN_THEME_BASE_URL = "https://wpscan.com/theme/"
+CVE_SEARCH_BASE_URL = "https://cve.mitre.org/cgi-bin/cvekey.cgi?keyword="
+FETCH_TIMEOUT_SECONDS = 30
+# Concurrent page fetches for unlimited scans; 429s are retried with backoff
+# by the shared session, so no fixed sleep between pages is needed.
+THEME_FETCH_THREADS = 5
+
 
 class ThemeScanner:
     """WordPress Theme Scanner."""
@@ -37,15 +51,23 @@ class ThemeScanner:
     def stop(self) -> None:
         self.stop_event.set()
 
-    def fetch_themes(self, page: int = 1, max_retries: int = 3) -> List[Dict[str, Any]]:
-        """Fetch themes from WordPress.org API."""
-        session = get_session()
-        url = "https://api.wordpress.org/themes/info/1.2/"
+    def fetch_themes(self, page: int = 1) -> List[Dict[str, Any]]:
+        """Fetch themes from WordPress.org API.
+
+        Retries and rate-limit backoff are handled by the shared session.
+        """
+        data = self._fetch_theme_page(page)
+        return data.get("themes", []) if data else []
+
+    def _fetch_theme_page(self, page: int) -> Dict[str, Any]:
+        """Fetch one raw query_themes response; empty when stopped or failed."""
+        if self.stop_event.is_set():
+            return {}
         params = {
             "action": "query_themes",
             "request[browse]": self.sort,
             "request[page]": page,
-            "request[per_page]": 100,
+            "request[per_page]": WORDPRESS_THEME_PAGE_SIZE,
             "request[fields][description]": True,
             "request[fields][downloaded]": True,
             "request[fields][last_updated]": True,
@@ -56,27 +78,29 @@ class ThemeScanner:
             "request[fields][screenshot_url]": True,
         }
 
-        for attempt in range(max_retries):
-            if self.stop_event.is_set():
-                return []
-            try:
-                response = session.get(url, params=params, timeout=30)
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("themes", []) if data else []
-                elif response.status_code == 429:
-                    wait_time = 5 * (attempt + 1)
-                    logger.warning("Theme API rate limited; waiting before retry", extra={"wait_time_seconds": wait_time, "page": page})
-                    time.sleep(wait_time)
-                    continue
-            except Exception as e:
-                logger.warning("Theme API request failed", exc_info=e)
-                time.sleep(2)
-                continue
-        return []
-
-    def process_theme(self, theme: Dict[str, Any]) -> Dict[str, Any]:
-        """Process a single theme and return analysis."""
+        try:
+            response = get_session().get(
+                WORDPRESS_THEME_API_URL,
+                params=params,
+                timeout=FETCH_TIMEOUT_SECONDS,
+            )
+            if response.status_code != 200:
+                logger.warning(
+                    "Theme API request failed",
+                    extra={"status_code": response.status_code, "page": page},
+                )
+                return {}
+            data = json_codec.loads(response.content)
+        except Exception as e:
+            logger.warning("Theme API request failed", exc_info=e)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def process_theme(self, theme: Dict[str, Any], today: Optional[int] = None) -> Dict[str, Any]:
+        """Process a single theme and return analysis.
+
+        ``today`` is an optional precomputed ``today_ordinal()`` shared by a page.
+        """
         name = theme.get("name", "Unknown")
         slug = theme.get("slug", "")
         version = theme.get("version", "?")
@@ -84,12 +108,12 @@ class ThemeScanner:
         last_updated = theme.get("last_updated", "")
         author = theme.get("author", "Unknown")
 
-        days_ago = calculate_days_ago(last_updated)
+        days_ago = calculate_days_ago(last_updated, today)
 
         # Check for risky patterns in theme
-        theme_tags = list(theme.get("tags", {}).keys())
+        exact_tags = RISKY_TAGS.intersection(theme.get("tags") or ())
         desc = theme.get("description", "").lower()
-        matched_tags = [tag for tag in RISKY_TAGS if tag in theme_tags or tag in desc]
+        matched_tags = [tag for tag in RISKY_TAGS if tag in exact_tags or tag in desc]
 
         # Simple risk assessment for themes
         risk_score = 0
@@ -106,6 +130,7 @@ class ThemeScanner:
         risk_level = (
             "HIGH" if risk_score >= 40 else ("MEDIUM" if risk_score >= 20 else "LOW")
         )
+        url_slug = quote(slug, safe="")
 
         return {
             "name": name,
@@ -118,46 +143,95 @@ class ThemeScanner:
             "risk_level": risk_level,
             "matched_tags": matched_tags,
             "download_link": theme.get("download_link", ""),
-            "wp_org_link": f"https://wordpress.org/themes/{slug}/",
-            "trac_link": f"https://themes.trac.wordpress.org/log/{slug}/",
-            "wpscan_link": f"https://wpscan.com/theme/{slug}",
-            "cve_search_link": f"https://cve.mitre.org/cgi-bin/cvekey.cgi?keyword={slug}",
+            "wp_org_link": f"{WORDPRESS_THEME_PAGE_BASE_URL}{url_slug}/",
+            "trac_link": f"{THEME_TRAC_LOG_BASE_URL}{url_slug}/",
+            "wpscan_link": f"{WPSCAN_THEME_BASE_URL}{url_slug}",
+            "cve_search_link": f"{CVE_SEARCH_BASE_URL}{url_slug}",
             "screenshot_url": theme.get("screenshot_url", ""),
         }
 
-    def scan(self) -> List[Dict[str, Any]]:
-        """Run the theme scan."""
-        found_count = 0
+    def _limit_reached(self) -> bool:
+        return self.limit > 0 and len(self.results) >= self.limit
+
+    def _record_themes(self, themes: List[Dict[str, Any]]) -> None:
+        """Analyse a page of themes and emit results until stopped or limited."""
+        today = today_ordinal()
+        for theme in themes:
+            if self.stop_event.is_set() or self._limit_reached():
+                return
 
+            result = self.process_theme(theme, today)
+            self.results.append(result)
+            if self.on_result:
+                self.on_result(result)
+
+    def _scan_sequentially(self) -> None:
+        """Fetch pages one by one so a result limit stops further requests."""
         for page in range(1, self.pages + 1):
-            if self.stop_event.is_set():
-                break
-            if self.limit > 0 and found_count >= self.limit:
+            if self.stop_event.is_set() or self._limit_reached():
                 break
 
             themes = self.fetch_themes(page)
-
             if not themes:
                 break
 
-            for theme in themes:
-                if self.stop_event.is_set():
-                    break
-                if self.limit > 0 and found_count >= self.limit:
-                    break
-
-                result = self.process_theme(theme)
-                found_count += 1
-                self.results.append(result)
-
-                if self.on_result:
-                    self.on_result(result)
-
+            self._record_themes(themes)
             if self.on_progress:
                 self.on_progress(page, self.pages)
 
-            if self.stop_event.is_set():
-                break
-            time.sleep(0.5)  # Rate limiting
+    def _available_pages(self, first_page: Dict[str, Any]) -> int:
+        """Clamp the requested page count to the catalogue size the API reports."""
+        reported = (first_page.get("info") or {}).get("pages")
+        if isinstance(reported, int) and reported > 0:
+            return min(self.pages, reported)
+        return self.pages
+
+    def _scan_concurrently(self) -> None:
+        """Fetch pages in parallel, analysing them in page order.
+
+        Page 1 is fetched first so the reported page count bounds the fan-out;
+        later pages are requested through a sliding window that stops at the
+        first empty page, as the sequential scan does.
+        """
+        first_page = self._fetch_theme_page(1)
+        themes = first_page.get("themes") or []
+        if not themes:
+            return
+        total_pages = self._available_pages(first_page)
+        self._record_themes(themes)
+        if self.on_progress:
+            self.on_progress(1, total_pages)
+        if total_pages <= 1:
+            return
+
+        workers = min(THEME_FETCH_THREADS, total_pages - 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            in_flight: Deque[Tuple[int, Future]] = deque()
+            next_page = 2
+            while True:
+                while next_page <= total_pages and len(in_flight) < workers:
+                    in_flight.append((next_page, executor.submit(self.fetch_themes, next_page)))
+                    next_page += 1
+                if not in_flight or self.stop_event.is_set():
+                    break
 
+                page, future = in_flight.popleft()
+                themes = future.result()
+                if not themes:
+                    break
+
+                self._record_themes(themes)
+                if self.on_progress:
+                    self.on_progress(page, total_pages)
+            for _, pending in in_flight:
+                pending.cancel()
+
+    def scan(self) -> List[Dict[str, Any]]:
+        """Run the theme scan."""
+        if self.pages <= 0:
+            return self.results
+        if self.limit > 0:
+            self._scan_sequentially()
+        else:
+            self._scan_concurrently()
         return self.results
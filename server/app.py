@@ -24,6 +24,7 @@ from database.models import ensure_db_dir
 from logger import build_rotating_file_handler
 from server import update_manager
 from server.limiter import limiter
+from server.responses import CodecJSONResponse
 from server.routers import ai, catalog, favorites, scans, semgrep, system
 from server.routers.semgrep_helpers import bootstrap_default_custom_rules
 from server.websockets import manager
@@ -143,6 +144,7 @@ def create_app() -> FastAPI:
         title="Temodar Agent Dashboard",
         description="WordPress Plugin & Theme Security Scanner",
         version=runtime_metadata.current_version,
+        default_response_class=CodecJSONResponse,
     )
     configure_application(app)
     return app
@@ -250,6 +252,10 @@ def register_scan_websocket(app: FastAPI) -> None:
             while True:
                 await websocket.receive_text()
         except WebSocketDisconnect:
+            pass
+        finally:
+            # Unregister on any exit so a socket that errored out (or was
+            # reaped by uvicorn's default keepalive ping) never lingers.
             await manager.disconnect(websocket, session_id)
 
 
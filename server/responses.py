@@ -0,0 +1,18 @@
+"""
+Response Classes
+
+JSON responses rendered through the shared codec (orjson when installed).
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from infrastructure import json_codec
+
+
+class CodecJSONResponse(JSONResponse):
+    """JSON response rendered through the shared codec (orjson when installed)."""
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps(content)
@@ -6,16 +6,16 @@ from typing import Optional
 
 from fastapi import APIRouter, Request
 
-from database.repository import ScanRepository
+from database.repository import get_shared_repository
 from server.limiter import limiter
 
 router = APIRouter(prefix="/api/catalog", tags=["catalog"])
-repo = ScanRepository()
+repo = get_shared_repository()
 
 
 @router.get("/plugins")
 @limiter.limit("200/minute")
-async def list_catalog_plugins(
+def list_catalog_plugins(
     request: Request,
     q: str = "",
     sort_by: str = "last_seen",
@@ -34,7 +34,7 @@ async def list_catalog_plugins(
 
 @router.get("/plugins/{slug}/sessions")
 @limiter.limit("200/minute")
-async def get_catalog_plugin_sessions(
+def get_catalog_plugin_sessions(
     request: Request,
     slug: str,
     is_theme: Optional[bool] = None,
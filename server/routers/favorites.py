@@ -3,25 +3,25 @@ Favorites Router
 """
 
 from fastapi import APIRouter
-from database.repository import ScanRepository
+from database.repository import get_shared_repository
 from server.schemas import FavoritePluginRequest
 
 router = APIRouter(prefix="/api/favorites", tags=["favorites"])
-repo = ScanRepository()
+repo = get_shared_repository()
 
 
 @router.get("")
-async def list_favorites():
+def list_favorites():
     return {"favorites": repo.get_favorites()}
 
 
 @router.post("")
-async def add_favorite(plugin: FavoritePluginRequest):
+def add_favorite(plugin: FavoritePluginRequest):
     success = repo.add_favorite(plugin.model_dump())
     return {"success": success}
 
 
 @router.delete("/{slug}")
-async def remove_favorite(slug: str):
+def remove_favorite(slug: str):
     success = repo.remove_favorite(slug)
     return {"success": success}
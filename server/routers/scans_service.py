@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple
 
 from fastapi import BackgroundTasks, HTTPException
 
 from analyzers.risk_labeler import apply_relative_risk_labels
 from database.repository import ScanRepository
+from infrastructure.ttl_cache import TTLCache
 from models import PluginResult, ScanConfig, ScanStatus
 from scanners.plugin_scanner import PluginScanner
 from scanners.theme_scanner import ThemeScanner
@@ -14,6 +19,18 @@ from server.websockets import manager
 
 active_scans: Dict[int, Any] = {}
 HIGH_RISK_LABELS = {"HIGH", "CRITICAL"}
+RESULT_BATCH_SIZE = 64
+RESULT_BATCH_MAX_DELAY_SECONDS = 0.5
+PROGRESS_MIN_INTERVAL_SECONDS = 0.1
+SCAN_WORKERS = 2
+# Long-running scanners get their own bounded pool so they never occupy the
+# loop's default executor, which also serves short DB and file work. Scans
+# beyond SCAN_WORKERS queue and stay pending until a worker frees up.
+SCAN_EXECUTOR = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="scan")
+RESULTS_CACHE_TTL_SECONDS = 30.0
+# Only finished sessions are cached: their result rows no longer change.
+CACHEABLE_RESULT_STATUSES = {ScanStatus.COMPLETED.value, ScanStatus.MERGED.value}
+_session_results_cache = TTLCache(RESULTS_CACHE_TTL_SECONDS)
 
 
 def request_scanner_stop(scanner: Any) -> None:
@@ -87,8 +104,13 @@ def _send_session_event_threadsafe(
     session_id: int,
     payload: Dict[str, Any],
 ) -> None:
-    """Schedule websocket event delivery from a worker thread."""
-    asyncio.run_coroutine_threadsafe(_send_session_event(session_id, payload), loop)
+    """Queue websocket event delivery from a worker thread."""
+    manager.publish_threadsafe(loop, session_id, payload)
+
+
+def _forget_cached_session_results(session_id: int) -> None:
+    """Drop cached result pages for a session that is being deleted."""
+    _session_results_cache.invalidate(lambda key: key[0] == session_id)
 
 
 def _scan_was_cancelled(session_id: int, repo: ScanRepository) -> bool:
@@ -139,11 +161,10 @@ async def _deduplicate_completed_scan(
     if not prev_session_id:
         return False
 
-    current_slugs = set(repo.get_result_slugs(session_id))
-    prev_slugs = set(repo.get_result_slugs(prev_session_id))
-    if current_slugs != prev_slugs:
+    if not repo.have_same_result_slugs(session_id, prev_session_id):
         return False
 
+    _forget_cached_session_results(session_id)
     repo.delete_session(session_id)
     repo.mark_session_merged(prev_session_id)
     await _send_session_event(
@@ -157,25 +178,96 @@ async def _deduplicate_completed_scan(
     return True
 
 
-def _save_plugin_result_and_emit(
+class _ResultBatcher:
+    """Persist streamed scan results in batches, then notify listeners in order.
+
+    Results are written one transaction per batch instead of one per result.
+    A batch is flushed once it holds RESULT_BATCH_SIZE results or once
+    RESULT_BATCH_MAX_DELAY_SECONDS have passed since the last flush. Events are
+    only sent after their batch is saved, so duplicate marking is reflected.
+    """
+
+    def __init__(
+        self,
+        *,
+        loop: asyncio.AbstractEventLoop,
+        session_id: int,
+        repo: ScanRepository,
+    ) -> None:
+        self._loop = loop
+        self._session_id = session_id
+        self._repo = repo
+        self._pending: List[Tuple[PluginResult, int]] = []
+        self.found_count = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(self, result: PluginResult) -> None:
+        with self._lock:
+            # Counted under the lock: plugin pages report results from several threads.
+            self.found_count += 1
+            self._pending.append((result, self.found_count))
+            if len(self._pending) >= RESULT_BATCH_SIZE or self._is_due():
+                self._flush_locked()
+
+    def flush_if_due(self) -> None:
+        with self._lock:
+            if self._pending and self._is_due():
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _is_due(self) -> bool:
+        return time.monotonic() - self._last_flush >= RESULT_BATCH_MAX_DELAY_SECONDS
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        # The batch stays queued until its transaction commits, so a failed
+        # write (e.g. a locked database) is retried by the next flush.
+        self._repo.save_results(self._session_id, [result for result, _ in self._pending])
+        batch, self._pending = self._pending, []
+        for result, found_count in batch:
+            _send_session_event_threadsafe(
+                self._loop,
+                self._session_id,
+                {
+                    "type": "result",
+                    "data": result.to_dict(),
+                    "found_count": found_count,
+                },
+            )
+
+
+def _mark_scan_running(
     *,
     loop: asyncio.AbstractEventLoop,
     session_id: int,
     repo: ScanRepository,
-    result: PluginResult,
-    found_count: int,
 ) -> None:
-    """Persist a plugin result and notify listeners."""
-    repo.save_result(session_id, result)
-    _send_session_event_threadsafe(
-        loop,
-        session_id,
-        {
-            "type": "result",
-            "data": result.to_dict(),
-            "found_count": found_count,
-        },
-    )
+    """Flag a session running once a scan worker has actually picked it up."""
+    repo.update_session_status(session_id, ScanStatus.RUNNING)
+    _send_session_event_threadsafe(loop, session_id, {"type": "start", "session_id": session_id})
+
+
+def _run_scanner_and_flush(
+    scanner: Any,
+    batcher: _ResultBatcher,
+    on_start: Callable[[], None],
+) -> None:
+    """Run a blocking scanner, always persisting the last partial batch.
+
+    ``on_start`` runs on the worker thread, so a scan waiting for a free
+    SCAN_EXECUTOR worker stays pending instead of being reported as running.
+    """
+    on_start()
+    try:
+        scanner.scan()
+    finally:
+        batcher.flush()
 
 
 def _emit_progress(
@@ -198,6 +290,71 @@ def _emit_progress(
     )
 
 
+class _ProgressThrottle:
+    """Send at most one progress event per PROGRESS_MIN_INTERVAL_SECONDS.
+
+    The first update after a quiet interval goes out immediately; updates
+    inside the interval only replace the pending value, which a timer on the
+    event loop sends when the interval ends. Completion (current >= total) is
+    always sent at once. ``close`` drops any pending update so nothing can be
+    queued behind the scan's terminal event.
+    """
+
+    def __init__(self, *, loop: asyncio.AbstractEventLoop, session_id: int) -> None:
+        self._loop = loop
+        self._session_id = session_id
+        self._latest: Tuple[int, int] | None = None
+        self._last_sent = float("-inf")
+        self._timer_scheduled = False
+        self._timer: asyncio.TimerHandle | None = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def update(self, current: int, total: int) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            now = time.monotonic()
+            wait = self._last_sent + PROGRESS_MIN_INTERVAL_SECONDS - now
+            if wait <= 0 or current >= total:
+                self._latest = None
+                self._last_sent = now
+            else:
+                self._latest = (current, total)
+                if self._timer_scheduled:
+                    return
+                self._timer_scheduled = True
+                self._loop.call_soon_threadsafe(self._schedule_send, wait)
+                return
+        _emit_progress(loop=self._loop, session_id=self._session_id, current=current, total=total)
+
+    def close(self) -> None:
+        """Drop the pending update and cancel its timer; call on the event loop."""
+        with self._lock:
+            self._closed = True
+            self._latest = None
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+
+    def _schedule_send(self, wait: float) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._timer = self._loop.call_later(wait, self._send_latest)
+
+    def _send_latest(self) -> None:
+        with self._lock:
+            self._timer_scheduled = False
+            self._timer = None
+            latest, self._latest = self._latest, None
+            if latest is None:
+                return
+            self._last_sent = time.monotonic()
+        current, total = latest
+        _emit_progress(loop=self._loop, session_id=self._session_id, current=current, total=total)
+
+
 def _count_high_risk_plugin_results(results: List[PluginResult]) -> int:
     """Count high-risk plugin results after relative labeling."""
     return sum(
@@ -214,34 +371,27 @@ async def _run_theme_scan(
     repo: ScanRepository,
 ) -> tuple[int, int]:
     """Run theme scanning mode and persist streaming results."""
-    found_count = 0
     high_risk_count = 0
     loop = asyncio.get_running_loop()
+    batcher = _ResultBatcher(loop=loop, session_id=session_id, repo=repo)
 
     def sync_on_theme_result(result: Dict[str, Any]) -> None:
-        nonlocal found_count, high_risk_count
-        found_count += 1
+        nonlocal high_risk_count
         if result.get("risk_level") == "HIGH":
             high_risk_count += 1
-
-        plugin_result = _build_theme_plugin_result(result)
-        _save_plugin_result_and_emit(
-            loop=loop,
-            session_id=session_id,
-            repo=repo,
-            result=plugin_result,
-            found_count=found_count,
-        )
+        batcher.add(_build_theme_plugin_result(result))
 
     scanner = ThemeScanner(
         pages=config.pages,
         limit=config.limit,
         sort=config.sort,
         on_result=sync_on_theme_result,
+        on_progress=lambda current, total: batcher.flush_if_due(),
     )
     active_scans[session_id] = scanner
-    await loop.run_in_executor(None, scanner.scan)
-    return found_count, high_risk_count
+    on_start = partial(_mark_scan_running, loop=loop, session_id=session_id, repo=repo)
+    await loop.run_in_executor(SCAN_EXECUTOR, _run_scanner_and_flush, scanner, batcher, on_start)
+    return batcher.found_count, high_risk_count
 
 
 async def _run_plugin_scan(
@@ -251,34 +401,29 @@ async def _run_plugin_scan(
     repo: ScanRepository,
 ) -> tuple[int, int]:
     """Run plugin scanning mode and persist streaming results."""
-    found_count = 0
     loop = asyncio.get_running_loop()
     scanner = PluginScanner(config)
     active_scans[session_id] = scanner
-
-    def sync_on_result(result: PluginResult) -> None:
-        nonlocal found_count
-        found_count += 1
-        _save_plugin_result_and_emit(
-            loop=loop,
-            session_id=session_id,
-            repo=repo,
-            result=result,
-            found_count=found_count,
-        )
+    batcher = _ResultBatcher(loop=loop, session_id=session_id, repo=repo)
+    progress = _ProgressThrottle(loop=loop, session_id=session_id)
 
     def sync_on_progress(current: int, total: int) -> None:
-        _emit_progress(
-            loop=loop,
-            session_id=session_id,
-            current=current,
-            total=total,
-        )
+        # Page boundaries also release a batch that has waited long enough.
+        batcher.flush_if_due()
+        progress.update(current, total)
 
-    scanner.on_result = sync_on_result
+    scanner.on_result = batcher.add
     scanner.on_progress = sync_on_progress
-    await loop.run_in_executor(None, scanner.scan)
-    return found_count, _count_high_risk_plugin_results(scanner.results)
+    on_start = partial(_mark_scan_running, loop=loop, session_id=session_id, repo=repo)
+    try:
+        await loop.run_in_executor(
+            SCAN_EXECUTOR, _run_scanner_and_flush, scanner, batcher, on_start
+        )
+    finally:
+        # Runs before complete/cancelled/error is sent, so a trailing
+        # progress event can never overtake the terminal one.
+        progress.close()
+    return batcher.found_count, _count_high_risk_plugin_results(scanner.results)
 
 
 async def _run_scan_mode(
@@ -339,9 +484,7 @@ async def _finalize_scan_completion(
 async def run_scan_task(session_id: int, config: ScanConfig, repo: ScanRepository) -> None:
     """Background task to run a scan (plugin or theme)."""
     try:
-        repo.update_session_status(session_id, ScanStatus.RUNNING)
-        await _send_session_event(session_id, {"type": "start", "session_id": session_id})
-
+        # The session stays pending until a scan worker marks it running.
         found_count, high_risk_count = await _run_scan_mode(
             session_id=session_id,
             config=config,
@@ -401,9 +544,17 @@ def get_scan_session_results(
     limit: int,
 ) -> Dict[str, Any]:
     """Return scan session results plus Semgrep state."""
-    get_scan_session(repo=repo, session_id=session_id)
-    results = repo.get_session_results(session_id, sort_by, sort_order, limit)
-    apply_relative_risk_labels_to_dict_results(results)
+    session = get_scan_session(repo=repo, session_id=session_id)
+    cache_key = (session_id, sort_by, sort_order, limit)
+    cacheable = session.get("status") in CACHEABLE_RESULT_STATUSES
+    rows = _session_results_cache.get(cache_key) if cacheable else None
+    if rows is None:
+        rows = repo.get_session_results(session_id, sort_by, sort_order, limit)
+        apply_relative_risk_labels_to_dict_results(rows)
+        if cacheable:
+            _session_results_cache.set(cache_key, rows)
+    # Semgrep status is live data, so it is attached to per-request copies.
+    results = [dict(row) for row in rows]
 
     slugs = [result["slug"] for result in results]
     semgrep_statuses = repo.get_semgrep_statuses_for_slugs(slugs)
@@ -419,6 +570,7 @@ def delete_scan_session(*, repo: ScanRepository, session_id: int) -> Dict[str, A
     if scanner is not None:
         request_scanner_stop(scanner)
 
+    _forget_cached_session_results(session_id)
     success = repo.delete_session(session_id)
     if not success:
         raise HTTPException(status_code=404, detail="Scan session not found")
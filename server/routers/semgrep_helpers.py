@@ -1,5 +1,6 @@
-import json
+import copy
 import logging
+import os
 import re
 import shutil
 import subprocess
@@ -9,12 +10,16 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+from infrastructure import json_codec
 from infrastructure.semgrep_runtime import get_semgrep_command, is_semgrep_available
 from runtime_paths import resolve_runtime_paths
 from scanners.semgrep_scanner import (
     DEFAULT_ENABLED_RULESETS,
     SEMGREP_COMMUNITY_SOURCES,
     SEMGREP_REGISTRY_RULESETS,
+    SEMGREP_STARTUP_ARGS,
+    YAML_SAFE_DUMPER,
+    YAML_SAFE_LOADER,
 )
 
 logger = logging.getLogger("temodar_agent")
@@ -43,6 +48,10 @@ PACKAGE_CUSTOM_RULES_PATH = (
     Path(__file__).resolve().parents[2] / "semgrep_results" / "custom_rules.yaml"
 )
 
+# Parsed rule YAML per path, reused while (mtime_ns, size) is unchanged;
+# GET /api/semgrep/rules is polled by the dashboard.
+_yaml_parse_cache: Dict[str, tuple[tuple[int, int], Any]] = {}
+
 
 def ensure_semgrep_state_dir() -> bool:
     try:
@@ -53,12 +62,24 @@ def ensure_semgrep_state_dir() -> bool:
         return False
 
 
+def _read_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing the last parse while the file is unchanged."""
+    stat = path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _yaml_parse_cache.get(str(path))
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=YAML_SAFE_LOADER)
+    _yaml_parse_cache[str(path)] = (version, data)
+    return data
+
+
 def _yaml_file_has_rules(path: Path) -> bool:
     try:
         if not path.exists():
             return False
-        with open(path, "r") as f:
-            data = yaml.safe_load(f) or {}
+        data = _read_yaml_cached(path) or {}
         rules = data.get("rules", []) if isinstance(data, dict) else []
         return isinstance(rules, list) and len(rules) > 0
     except Exception:
@@ -80,6 +101,8 @@ def bootstrap_default_custom_rules() -> None:
                 continue
             try:
                 shutil.copy2(candidate, CUSTOM_RULES_PATH)
+                # copy2 keeps the source mtime, so drop any stale parse explicitly.
+                _yaml_parse_cache.pop(str(CUSTOM_RULES_PATH), None)
                 break
             except Exception:
                 logger.warning("Failed to bootstrap default Semgrep custom rules from %s.", candidate)
@@ -97,8 +120,8 @@ def get_disabled_config() -> Dict[str, List[str]]:
     legacy_default_rulesets = {"cwe-top-25"}
     if DISABLED_CONFIG_PATH.exists():
         try:
-            with open(DISABLED_CONFIG_PATH, "r") as f:
-                config = json.load(f)
+            with open(DISABLED_CONFIG_PATH, "rb") as f:
+                config = json_codec.loads(f.read())
                 before_rulesets = set(config.get("rulesets", []))
                 before_extras = set(config.get("extra_rulesets", []))
                 normalized = {
@@ -136,8 +159,8 @@ def save_disabled_config(config: Dict[str, List[str]]):
     if not ensure_semgrep_state_dir():
         raise PermissionError("Semgrep persistent state is not writable in the current runtime environment.")
     DISABLED_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(DISABLED_CONFIG_PATH, "w") as f:
-        json.dump(config, f)
+    with open(DISABLED_CONFIG_PATH, "wb") as f:
+        f.write(json_codec.dumps(config))
 
 
 def get_active_rulesets() -> List[str]:
@@ -176,14 +199,14 @@ def _validate_slug_or_raise(slug: str) -> str:
 
 def _validate_rule_id_or_raise(rule_id: str) -> str:
     value = (rule_id or "").strip()
-    if not RULE_ID_PATTERN.match(value):
+    if not RULE_ID_PATTERN.fullmatch(value):
         raise ValueError("Invalid rule ID format")
     return value
 
 
 def validate_ruleset_or_raise(ruleset_id: str) -> str:
     ruleset_id = _canonicalize_ruleset_value(ruleset_id)
-    if not RULESET_PATTERN.match(ruleset_id):
+    if not RULESET_PATTERN.fullmatch(ruleset_id):
         raise ValueError("Invalid ruleset format")
     return ruleset_id
 
@@ -220,7 +243,7 @@ def _validate_semgrep_rules_config(rules_config: Dict[str, Any]) -> Optional[str
             temp_path = tmp.name
 
         result = subprocess.run(
-            [*semgrep_command, "--validate", "--config", temp_path],
+            [*semgrep_command, *SEMGREP_STARTUP_ARGS, "--validate", "--config", temp_path],
             capture_output=True,
             text=True,
             timeout=30,
@@ -249,30 +272,29 @@ def load_custom_rules() -> List[Dict[str, Any]]:
     custom_rules: List[Dict[str, Any]] = []
     if CUSTOM_RULES_PATH.exists():
         try:
-            with open(CUSTOM_RULES_PATH, "r") as f:
-                custom_yaml = yaml.safe_load(f)
-                if custom_yaml and "rules" in custom_yaml:
-                    for rule in custom_yaml["rules"]:
-                        rule_id = rule.get("id", "unknown")
-                        pattern = rule.get("pattern", "")
-                        if not pattern and "patterns" in rule:
-                            patterns = rule["patterns"]
-                            if patterns:
-                                pattern = (
-                                    str(patterns[0])
-                                    if isinstance(patterns[0], str)
-                                    else patterns[0].get("pattern", "Complex")
-                                )
-
-                        custom_rules.append(
-                            {
-                                "id": rule_id,
-                                "message": rule.get("message", ""),
-                                "severity": rule.get("severity", "WARNING"),
-                                "pattern": pattern,
-                                "is_custom": True,
-                            }
-                        )
+            custom_yaml = _read_yaml_cached(CUSTOM_RULES_PATH)
+            if custom_yaml and "rules" in custom_yaml:
+                for rule in custom_yaml["rules"]:
+                    rule_id = rule.get("id", "unknown")
+                    pattern = rule.get("pattern", "")
+                    if not pattern and "patterns" in rule:
+                        patterns = rule["patterns"]
+                        if patterns:
+                            pattern = (
+                                str(patterns[0])
+                                if isinstance(patterns[0], str)
+                                else patterns[0].get("pattern", "Complex")
+                            )
+
+                    custom_rules.append(
+                        {
+                            "id": rule_id,
+                            "message": rule.get("message", ""),
+                            "severity": rule.get("severity", "WARNING"),
+                            "pattern": pattern,
+                            "is_custom": True,
+                        }
+                    )
         except Exception as e:
             logger.warning("Error loading custom rules", exc_info=e)
     return custom_rules
@@ -282,8 +304,8 @@ def load_custom_rules_document() -> Dict[str, Any]:
     bootstrap_default_custom_rules()
     if CUSTOM_RULES_PATH.exists():
         try:
-            with open(CUSTOM_RULES_PATH, "r") as f:
-                return yaml.safe_load(f) or {"rules": []}
+            # Callers edit and save the document, so never hand out the cached one.
+            return copy.deepcopy(_read_yaml_cached(CUSTOM_RULES_PATH)) or {"rules": []}
         except Exception:
             pass
     return {"rules": []}
@@ -293,8 +315,28 @@ def save_custom_rules_document(rules_data: Dict[str, Any]) -> None:
     if not ensure_semgrep_state_dir():
         raise PermissionError("Semgrep persistent state is not writable in the current runtime environment.")
     CUSTOM_RULES_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(CUSTOM_RULES_PATH, "w") as f:
-        yaml.dump(rules_data, f, default_flow_style=False, sort_keys=False)
+    cache_key = str(CUSTOM_RULES_PATH)
+    _yaml_parse_cache.pop(cache_key, None)
+    # Write to a sibling temp file and rename so readers never see a partial file.
+    fd, temp_path = tempfile.mkstemp(
+        dir=CUSTOM_RULES_PATH.parent, prefix=".custom_rules.", suffix=".yaml.tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            yaml.dump(
+                rules_data,
+                f,
+                Dumper=YAML_SAFE_DUMPER,
+                default_flow_style=False,
+                sort_keys=False,
+            )
+        os.replace(temp_path, CUSTOM_RULES_PATH)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+    # Seed the parse cache with what was just written; the next GET skips the parse.
+    stat = CUSTOM_RULES_PATH.stat()
+    _yaml_parse_cache[cache_key] = ((stat.st_mtime_ns, stat.st_size), copy.deepcopy(rules_data))
 
 
 def build_semgrep_rules_response() -> Dict[str, Any]:
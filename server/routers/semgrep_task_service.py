@@ -4,13 +4,16 @@ import asyncio
 import json
 import logging
 import shutil
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from database.repository import ScanRepository
 from downloaders.plugin_downloader import PluginDownloader
 from runtime_paths import resolve_runtime_paths
-from scanners.semgrep_scanner import SemgrepScanner
+from scanners.semgrep_scanner import SEMGREP_MAX_CONCURRENT_SCANS, SemgrepScanner
 from server.routers.semgrep_helpers import (
     CUSTOM_RULES_PATH,
     _extract_bulk_plugin_meta,
@@ -25,6 +28,10 @@ SEMGREP_OUTPUTS_DIR = RUNTIME_PATHS.semgrep_outputs_dir
 logger = logging.getLogger("temodar_agent")
 BULK_SCAN_PAUSE_ITERATIONS = 5
 BULK_SCAN_PAUSE_SECONDS = 0.1
+SEMGREP_WORKERS = SEMGREP_MAX_CONCURRENT_SCANS
+# Downloads and Semgrep runs take seconds to minutes, so they get their own
+# bounded pool instead of the loop's default executor.
+SEMGREP_EXECUTOR = ThreadPoolExecutor(max_workers=SEMGREP_WORKERS, thread_name_prefix="semgrep")
 
 
 def stop_requested(stop_event: Optional[asyncio.Event]) -> bool:
@@ -37,16 +44,22 @@ def mark_semgrep_scan_stopped(*, repo: ScanRepository, scan_id: int) -> None:
     repo.update_semgrep_scan(scan_id, "failed", error="Stopped by user")
 
 
+@lru_cache(maxsize=1)
+def get_plugin_downloader() -> PluginDownloader:
+    """Return the downloader shared by all Semgrep scan tasks."""
+    return PluginDownloader()
+
+
 async def download_plugin_for_semgrep(
     *,
     slug: str,
     download_url: str,
 ) -> str | None:
     """Download and extract a plugin for Semgrep scanning."""
-    downloader = PluginDownloader()
+    downloader = get_plugin_downloader()
     loop = asyncio.get_running_loop()
     plugin_path = await loop.run_in_executor(
-        None,
+        SEMGREP_EXECUTOR,
         downloader.download_and_extract,
         str(download_url),
         slug,
@@ -85,29 +98,52 @@ def write_disabled_rules_snapshot(output_dir: Path) -> None:
         logger.warning("Failed to write disabled rules for Semgrep scan.")
 
 
-async def execute_semgrep_scan(*, output_dir: Path, plugin_path: str, slug: str):
-    """Execute Semgrep against a prepared plugin path."""
+async def execute_semgrep_scan(
+    *,
+    output_dir: Path,
+    plugin_path: str,
+    slug: str,
+    stop_event: Optional[asyncio.Event] = None,
+):
+    """Execute Semgrep against a prepared plugin path.
+
+    A stop request on ``stop_event`` is forwarded to the scanner so the running
+    Semgrep process is killed instead of being waited out.
+    """
     scanner = SemgrepScanner(
         output_dir=str(output_dir),
         use_registry_rules=True,
         registry_rulesets=get_active_rulesets(),
     )
     loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, scanner.scan_plugin, str(plugin_path), slug)
+    scan_future = loop.run_in_executor(
+        SEMGREP_EXECUTOR, scanner.scan_plugin, str(plugin_path), slug
+    )
+    if stop_event is None:
+        return await scan_future
+
+    stop_waiter = asyncio.ensure_future(stop_event.wait())
+    try:
+        await asyncio.wait({scan_future, stop_waiter}, return_when=asyncio.FIRST_COMPLETED)
+        if stop_event.is_set():
+            scanner.stop()
+        return await scan_future
+    finally:
+        stop_waiter.cancel()
 
 
 
 def build_semgrep_summary(findings: List[Dict[str, Any]], errors: Optional[List[str]] = None) -> Dict[str, Any]:
     """Build the persisted summary payload for Semgrep findings."""
+    severities = Counter(
+        finding.get("extra", {}).get("severity", "INFO") for finding in findings
+    )
     summary = {
         "total_findings": len(findings),
-        "breakdown": {"ERROR": 0, "WARNING": 0, "INFO": 0},
+        "breakdown": {"ERROR": 0, "WARNING": 0, "INFO": 0, **severities},
     }
     if errors:
         summary["errors"] = list(errors)
-    for finding in findings:
-        severity = finding.get("extra", {}).get("severity", "INFO")
-        summary["breakdown"][severity] = summary["breakdown"].get(severity, 0) + 1
     return summary
 
 
@@ -58,6 +58,7 @@ async def run_plugin_semgrep_scan(
             output_dir=output_dir,
             plugin_path=str(plugin_path),
             slug=safe_slug,
+            stop_event=stop_event,
         )
         summary = persist_semgrep_findings(
             repo=repo,
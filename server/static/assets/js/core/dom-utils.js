@@ -1,12 +1,20 @@
 (function() {
+const HTML_ESCAPE_TABLE = {
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#039;",
+};
+const HTML_ESCAPE_PATTERN = /[&<>"']/g;
+
+function escapeHtmlChar(char) {
+    return HTML_ESCAPE_TABLE[char];
+}
+
 function escapeHtml(text) {
     if (text === null || text === undefined) return '';
-    return String(text)
-        .replace(/&/g, "&amp;")
-        .replace(/</g, "&lt;")
-        .replace(/>/g, "&gt;")
-        .replace(/"/g, "&quot;")
-        .replace(/'/g, "&#039;");
+    return String(text).replace(HTML_ESCAPE_PATTERN, escapeHtmlChar);
 }
 
 function truncateText(text, length = 160) {
@@ -1,5 +1,6 @@
 (function() {
     const runtime = window.temodarAgentRuntime;
+    const frameDecoder = new TextDecoder();
 
     function getRunButtonMarkup() {
         return '<svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><polygon points="5 3 19 12 5 21 5 3"></polygon></svg><span>RUN SCAN</span>';
@@ -183,6 +184,8 @@
         closeActiveSocket();
 
         const ws = new WebSocket(wsUrl);
+        // Scan events arrive as binary UTF-8 JSON frames.
+        ws.binaryType = 'arraybuffer';
         runtime.setSocket(ws);
 
         ws.onopen = () => {
@@ -192,7 +195,8 @@
         };
         ws.onmessage = (event) => {
             if (runtime.getSocket() !== ws) return;
-            const payload = JSON.parse(event.data);
+            const text = typeof event.data === 'string' ? event.data : frameDecoder.decode(event.data);
+            const payload = JSON.parse(text);
             window.handleMessage(payload, sessionId);
         };
         ws.onclose = () => {
@@ -251,6 +255,9 @@
         if (msg && msg.session_id && currentScanId && Number(msg.session_id) !== Number(currentScanId)) return;
 
         switch (msg.type) {
+            case 'batch':
+                (Array.isArray(msg.events) ? msg.events : []).forEach((event) => window.handleMessage(event, sourceSessionId));
+                break;
             case 'start':
                 window.logTerminal('Scan execution started...', 'info');
                 window.setScanProgressState(12, 'Running', 'Execution started');
@@ -3,56 +3,158 @@ WebSocket Connection Manager
 """
 
 import asyncio
-from typing import Dict, List
+import logging
+from typing import Any, Dict, List, Optional, Set
 from fastapi import WebSocket
 
+from infrastructure import json_codec
+
+logger = logging.getLogger("temodar_agent")
+
+BATCH_EVENT_TYPE = "batch"
+# A client that cannot take a frame within this window is treated as dead,
+# so one stalled socket cannot hold up the session's outbox indefinitely.
+SEND_TIMEOUT_SECONDS = 10.0
+# Dropped sockets are closed so the client notices and reconciles its state;
+# a peer too stalled to take a close frame is given up on after this long.
+CLOSE_TIMEOUT_SECONDS = 1.0
+# Batches at least this long are encoded on a worker thread; smaller frames
+# encode faster than the thread hop costs.
+OFFLOAD_ENCODE_MIN_EVENTS = 32
+
 
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: Dict[int, List[WebSocket]] = {}
+        self.active_connections: Dict[int, Set[WebSocket]] = {}
         self.lock = asyncio.Lock()
+        # Per-session outbox: events queued while a send is in flight are
+        # coalesced into one batch frame by that session's flusher task.
+        self._pending: Dict[int, List[Dict[str, Any]]] = {}
+        self._flushers: Dict[int, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket, session_id: int):
         await websocket.accept()
         async with self.lock:
-            if session_id not in self.active_connections:
-                self.active_connections[session_id] = []
-            self.active_connections[session_id].append(websocket)
+            self.active_connections.setdefault(session_id, set()).add(websocket)
 
     async def disconnect(self, websocket: WebSocket, session_id: int):
         async with self.lock:
-            if session_id in self.active_connections:
-                if websocket in self.active_connections[session_id]:
-                    self.active_connections[session_id].remove(websocket)
-                if not self.active_connections[session_id]:
-                    del self.active_connections[session_id]
+            session_connections = self.active_connections.get(session_id)
+            if session_connections is None:
+                return
+            session_connections.discard(websocket)
+            if not session_connections:
+                del self.active_connections[session_id]
 
     async def send_to_session(self, session_id: int, message: dict):
-        # Create a copy of connections to iterate over safely without holding lock during send
-        connections_to_send = []
-        async with self.lock:
-            if session_id in self.active_connections:
-                connections_to_send = list(self.active_connections[session_id])
+        """Queue a message for a session and wait until it has been delivered."""
+        await asyncio.shield(self._enqueue(session_id, message))
+
+    def publish_threadsafe(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        session_id: int,
+        message: dict,
+    ) -> None:
+        """Queue a message from a worker thread without waiting for delivery."""
+        loop.call_soon_threadsafe(self._enqueue, session_id, message)
 
-        failed_connections: List[WebSocket] = []
-        for connection in connections_to_send:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                failed_connections.append(connection)
+    def _enqueue(self, session_id: int, message: dict) -> asyncio.Task:
+        self._pending.setdefault(session_id, []).append(message)
+        flusher = self._flushers.get(session_id)
+        if flusher is None:
+            flusher = asyncio.get_running_loop().create_task(self._flush(session_id))
+            self._flushers[session_id] = flusher
+        return flusher
+
+    async def _flush(self, session_id: int) -> None:
+        """Deliver queued events in order, one frame per drained batch."""
+        try:
+            while True:
+                events = self._pending.pop(session_id, None)
+                if not events:
+                    return
+                if len(events) == 1:
+                    frame = events[0]
+                else:
+                    frame = {"type": BATCH_EVENT_TYPE, "events": events}
+                await self._broadcast(session_id, frame)
+        finally:
+            self._flushers.pop(session_id, None)
+
+    async def _broadcast(self, session_id: int, frame: dict) -> None:
+        # Copy connections so the lock is not held while sending.
+        async with self.lock:
+            connections_to_send = list(self.active_connections.get(session_id, ()))
+        if not connections_to_send:
+            return
 
+        # Encode once for every subscriber and send the UTF-8 bytes as-is;
+        # text frames would need a decode here and a re-encode in the server.
+        if len(frame.get("events", ())) >= OFFLOAD_ENCODE_MIN_EVENTS:
+            payload = await asyncio.to_thread(_encode_frame, frame)
+        else:
+            payload = _encode_frame(frame)
+        if payload is None:
+            return
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.wait_for(connection.send_bytes(payload), SEND_TIMEOUT_SECONDS)
+                for connection in connections_to_send
+            ),
+            return_exceptions=True,
+        )
+        failed_connections = [
+            connection
+            for connection, outcome in zip(connections_to_send, outcomes)
+            if isinstance(outcome, BaseException)
+        ]
         if not failed_connections:
             return
 
         async with self.lock:
             session_connections = self.active_connections.get(session_id)
-            if not session_connections:
-                return
-            for failed in failed_connections:
-                if failed in session_connections:
-                    session_connections.remove(failed)
-            if not session_connections:
-                del self.active_connections[session_id]
+            if session_connections:
+                session_connections.difference_update(failed_connections)
+                if not session_connections:
+                    del self.active_connections[session_id]
+
+        await asyncio.gather(
+            *(self._close_quietly(connection) for connection in failed_connections)
+        )
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket) -> None:
+        """Best-effort close of a socket that failed or timed out on send."""
+        try:
+            await asyncio.wait_for(websocket.close(code=1011), CLOSE_TIMEOUT_SECONDS)
+        except Exception:
+            pass
+
+
+def _encode_frame(frame: Dict[str, Any]) -> Optional[bytes]:
+    """Encode a frame, dropping only the events that cannot be serialised.
+
+    Returns None when nothing in the frame is encodable.
+    """
+    try:
+        return json_codec.dumps(frame)
+    except (TypeError, ValueError):
+        if frame.get("type") != BATCH_EVENT_TYPE:
+            logger.warning("Dropping unencodable WebSocket event %r", frame.get("type"), exc_info=True)
+            return None
+
+    encodable = []
+    for event in frame["events"]:
+        try:
+            json_codec.dumps(event)
+        except (TypeError, ValueError):
+            logger.warning("Dropping unencodable WebSocket event %r", event.get("type"), exc_info=True)
+        else:
+            encodable.append(event)
+    if not encodable:
+        return None
+    return json_codec.dumps({"type": BATCH_EVENT_TYPE, "events": encodable})
 
 
 manager = ConnectionManager()
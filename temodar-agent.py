@@ -11,6 +11,7 @@ def main() -> None:
     app = create_app()
     host = os.getenv("TEMODAR_AGENT_HOST", "127.0.0.1")
     port = int(os.getenv("TEMODAR_AGENT_PORT", "8080"))
+    # loop/http default to "auto": uvloop and httptools are used when installed.
     uvicorn.run(app, host=host, port=port, log_level="warning", workers=1)
 
 
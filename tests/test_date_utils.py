@@ -0,0 +1,18 @@
+from datetime import date
+
+from utils.date_utils import UNKNOWN_DAYS_AGO, calculate_days_ago
+
+
+def test_calculate_days_ago_parses_wordpress_dates():
+    today = date(2024, 1, 11).toordinal()
+
+    assert calculate_days_ago("2024-01-01 10:00am GMT", today) == 10
+    assert calculate_days_ago("2024-1-1", today) == 10
+    assert calculate_days_ago("2024-01-11", today) == 0
+    assert calculate_days_ago(date.today().isoformat()) == 0
+
+
+def test_calculate_days_ago_returns_sentinel_for_missing_or_invalid_dates():
+    assert calculate_days_ago(None) == UNKNOWN_DAYS_AGO
+    assert calculate_days_ago("") == UNKNOWN_DAYS_AGO
+    assert calculate_days_ago("not a date") == UNKNOWN_DAYS_AGO
@@ -0,0 +1,33 @@
+from infrastructure import http_client
+from infrastructure.http_client import DecorrelatedJitterRetry
+
+
+def test_decorrelated_jitter_backoff_grows_within_bounds(monkeypatch):
+    monkeypatch.setattr(http_client.random, "uniform", lambda low, high: high)
+    retry = http_client._build_retry_strategy()
+    assert isinstance(retry, DecorrelatedJitterRetry)
+    assert retry.get_backoff_time() == 0.0
+
+    delays = []
+    for _ in range(3):
+        retry = retry.new(total=5, status=5, history=retry.history + (object(),))
+        delays.append(retry.get_backoff_time())
+        assert retry.get_backoff_time() == delays[-1]
+
+    assert delays == [1.0, 3.0, 9.0]
+
+    capped = DecorrelatedJitterRetry(total=1, previous_backoff=50.0, history=(object(),))
+    assert capped.get_backoff_time() == http_client.BACKOFF_CAP_SECONDS
+
+
+def test_get_session_reuses_shared_session_without_downsizing(monkeypatch):
+    monkeypatch.setattr(http_client, "_session", None)
+    monkeypatch.setattr(http_client, "_configured_pool_size", 0)
+
+    session = http_client.get_session(pool_size=5)
+    assert http_client.get_session(pool_size=1) is session
+    assert http_client._configured_pool_size == 5
+
+    assert http_client.get_session(pool_size=10) is session
+    assert http_client._configured_pool_size == 10
+    session.close()
@@ -0,0 +1,14 @@
+from infrastructure import json_codec
+
+
+def test_dumps_emits_compact_utf8_bytes_with_and_without_orjson(monkeypatch):
+    document = {"name": "Café", "tags": ["a", "b"], "count": 2}
+
+    encoded = json_codec.dumps(document)
+    assert isinstance(encoded, bytes)
+    assert json_codec.loads(encoded) == document
+
+    monkeypatch.setattr(json_codec, "orjson", None)
+    fallback = json_codec.dumps(document)
+    assert fallback == '{"name":"Café","tags":["a","b"],"count":2}'.encode("utf-8")
+    assert json_codec.loads(fallback) == document
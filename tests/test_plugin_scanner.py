@@ -0,0 +1,262 @@
+import json
+import threading
+
+from models import ScanConfig
+from scanners import plugin_scanner
+from scanners.plugin_scanner import PluginScanner, analyze_changelog
+
+
+def _build_plugin(**overrides):
+    plugin = {
+        "name": "Contact Form Builder",
+        "slug": "contact-form-builder",
+        "version": "1.2.3",
+        "active_installs": 5000,
+        "last_updated": "2020-01-01 10:00am GMT",
+        "short_description": "Drag and drop forms with ajax submissions.",
+        "tags": {"contact": "Contact", "email": "Email"},
+        "tested": "6.1",
+        "author": "Example Dev",
+        "rating": 80,
+        "support_threads": 10,
+        "support_threads_resolved": 5,
+        "sections": {"changelog": "= 1.2.3 =\n* Security fix for XSS in the form preview."},
+        "download_link": "https://downloads.wordpress.org/plugin/contact-form-builder.zip",
+    }
+    plugin.update(overrides)
+    return plugin
+
+
+def test_matches_any_tag_checks_plugin_tags_name_and_description():
+    matched = plugin_scanner._matches_any_tag(
+        {"contact", "ajax", "upload", "gallery"},
+        {"contact"},
+        plugin_scanner._tag_haystack("my plugin", "handles ajax uploads"),
+    )
+
+    assert sorted(matched) == ["ajax", "contact", "upload"]
+
+
+def test_analyze_changelog_only_scans_recent_entries():
+    recent = "* Security fix for XSS.\n"
+    padding = "x" * plugin_scanner.CHANGELOG_SCAN_CHARS
+    sec_flags, feat_flags = analyze_changelog(
+        {"changelog": recent + padding + "* Added shortcode support."}
+    )
+
+    assert {"security", "fix", "xss", "security fix"} <= set(sec_flags)
+    assert "shortcode" not in feat_flags
+    assert analyze_changelog({}) == ([], [])
+
+
+def test_analyze_changelog_keeps_substring_and_phrase_matching():
+    sec_flags, feat_flags = analyze_changelog(
+        {"changelog": "* Fixed privilege escalation (CVE-2024-1234).\n* Now allows file uploads."}
+    )
+
+    assert {"fix", "privilege escalation", "cve-"} <= set(sec_flags)
+    assert {"now allows", "file upload"} <= set(feat_flags)
+
+
+def test_process_plugin_builds_result_for_matching_plugin():
+    scanner = PluginScanner(ScanConfig(min_installs=1000, smart=True, user_facing=True))
+
+    result = scanner.process_plugin(_build_plugin())
+
+    assert result is not None
+    assert result.slug == "contact-form-builder"
+    assert {"contact", "form", "ajax"} <= set(result.risk_tags)
+    assert result.is_user_facing is True
+    assert "xss" in result.security_flags
+    assert result.wp_org_link == "https://wordpress.org/plugins/contact-form-builder/"
+    assert result.trac_link == "https://plugins.trac.wordpress.org/log/contact-form-builder/"
+
+
+def test_process_plugin_escapes_slug_in_links_only():
+    result = PluginScanner(ScanConfig(min_installs=0)).process_plugin(_build_plugin(slug="odd slug&x"))
+
+    assert result.slug == "odd slug&x"
+    assert result.wp_org_link == "https://wordpress.org/plugins/odd%20slug%26x/"
+    assert result.cve_search_link.endswith("keyword=odd%20slug%26x")
+
+
+def test_process_plugin_rejects_plugins_failing_filters():
+    scanner = PluginScanner(ScanConfig(min_installs=10000))
+    assert scanner.process_plugin(_build_plugin()) is None
+
+    smart_scanner = PluginScanner(ScanConfig(min_installs=0, smart=True))
+    assert (
+        smart_scanner.process_plugin(
+            _build_plugin(name="Zz", short_description="Nothing here.", tags={})
+        )
+        is None
+    )
+
+
+class _FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode("utf-8")
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append((url, params, timeout))
+        return self.responses.pop(0)
+
+
+def test_fetch_plugins_leaves_retries_to_the_session_transport(monkeypatch):
+    session = _FakeSession([_FakeResponse(429)])
+    monkeypatch.setattr(plugin_scanner, "get_session", lambda: session)
+
+    assert plugin_scanner.fetch_plugins(1, "updated") == []
+    assert len(session.calls) == 1
+
+    session = _FakeSession([_FakeResponse(200, {"plugins": [{"slug": "akismet"}]})])
+    monkeypatch.setattr(plugin_scanner, "get_session", lambda: session)
+
+    assert plugin_scanner.fetch_plugins(2, "popular") == [{"slug": "akismet"}]
+    assert session.calls[0][1]["request[page]"] == 2
+
+
+def test_process_plugin_fetches_changelog_only_for_surviving_plugins(monkeypatch):
+    session = _FakeSession(
+        [_FakeResponse(200, {"sections": {"changelog": "* Fixed CSRF in settings."}})]
+    )
+    monkeypatch.setattr(plugin_scanner, "get_session", lambda: session)
+    scanner = PluginScanner(ScanConfig(min_installs=1000))
+
+    plugin = _build_plugin()
+    del plugin["sections"]
+    assert scanner.process_plugin(dict(plugin, active_installs=10)) is None
+    assert session.calls == []
+
+    result = scanner.process_plugin(plugin)
+
+    assert result is not None
+    assert "csrf" in result.security_flags
+    assert len(session.calls) == 1
+    params = session.calls[0][1]
+    assert params["action"] == "plugin_information"
+    assert params["request[slug]"] == "contact-form-builder"
+
+
+def test_fetch_plugin_sections_logs_throttled_and_malformed_responses(monkeypatch, caplog):
+    session = _FakeSession([_FakeResponse(429)])
+    monkeypatch.setattr(plugin_scanner, "get_session", lambda: session)
+
+    with caplog.at_level("WARNING", logger=plugin_scanner.logger.name):
+        assert plugin_scanner.fetch_plugin_sections("contact-form-builder") == {}
+    assert any(
+        "contact-form-builder" in record.getMessage() and "429" in record.getMessage()
+        for record in caplog.records
+    )
+
+    caplog.clear()
+    malformed = _FakeResponse(200)
+    malformed.content = b"<html>"
+    monkeypatch.setattr(plugin_scanner, "get_session", lambda: _FakeSession([malformed]))
+
+    with caplog.at_level("WARNING", logger=plugin_scanner.logger.name):
+        assert plugin_scanner.fetch_plugin_sections("contact-form-builder") == {}
+    assert any("not valid JSON" in record.getMessage() for record in caplog.records)
+
+
+def test_store_result_latches_limit_and_stops_scanning():
+    scanner = PluginScanner(ScanConfig(limit=2))
+    first = scanner.process_plugin(_build_plugin())
+    assert first is not None
+
+    assert scanner._store_result(first) is True
+    assert scanner._should_stop() is False
+    assert scanner._store_result(first) is True
+    assert scanner._should_stop() is True
+    assert scanner._store_result(first) is False
+    assert scanner.found_count == 2
+    assert len(scanner.results) == 2
+
+
+def test_resolve_user_facing_only_needs_one_matching_tag():
+    haystack = plugin_scanner._tag_haystack("gallery pro", "")
+
+    assert plugin_scanner._resolve_user_facing(ScanConfig(user_facing=True), set(), haystack) == (
+        True,
+        True,
+    )
+    assert plugin_scanner._resolve_user_facing(
+        ScanConfig(user_facing=True), set(), plugin_scanner._tag_haystack("zz", "")
+    ) == (False, False)
+    assert plugin_scanner._resolve_user_facing(ScanConfig(), {"slider"}, "") == (True, True)
+
+
+def test_filter_thresholds_match_scan_config_semantics():
+    scanner = PluginScanner(ScanConfig(min_installs=100, max_installs=1000, max_days=400))
+    assert scanner._passes_install_filters(100) is True
+    assert scanner._passes_install_filters(1001) is False
+    assert scanner._passes_update_age_filters(-3) is True
+    assert scanner._passes_update_age_filters(401) is False
+
+    abandoned = PluginScanner(ScanConfig(min_installs=0, abandoned=True, min_days=30))
+    assert abandoned._passes_install_filters(10**9) is True
+    assert abandoned._passes_update_age_filters(729) is False
+    assert abandoned._passes_update_age_filters(730) is True
+
+
+class _RoutingSession:
+    """Thread-safe fake serving listing pages and per-plugin changelogs."""
+
+    def __init__(self, listing):
+        self.listing = listing
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        with self.lock:
+            self.calls.append(params["action"])
+        if params["action"] == "query_plugins":
+            return _FakeResponse(200, {"plugins": self.listing})
+        return _FakeResponse(200, {"sections": {"changelog": "* Fixed XSS."}})
+
+
+def _listing_without_sections(count):
+    plugins = []
+    for index in range(count):
+        plugin = _build_plugin(slug=f"plugin-{index}")
+        del plugin["sections"]
+        plugins.append(plugin)
+    return plugins
+
+
+def test_scan_page_fetches_one_changelog_per_surviving_plugin(monkeypatch):
+    listing = _listing_without_sections(5) + [_build_plugin(slug="tiny", active_installs=1)]
+    session = _RoutingSession(listing)
+    monkeypatch.setattr(plugin_scanner, "get_session", lambda: session)
+    scanner = PluginScanner(ScanConfig(min_installs=1000))
+
+    results = scanner.scan_page(1)
+
+    assert [result.slug for result in results] == [f"plugin-{index}" for index in range(5)]
+    assert all("xss" in result.security_flags for result in results)
+    assert session.calls.count("query_plugins") == 1
+    assert session.calls.count("plugin_information") == 5
+
+
+def test_scan_page_skips_changelog_fetches_past_the_limit_or_after_stop(monkeypatch):
+    session = _RoutingSession(_listing_without_sections(20))
+    monkeypatch.setattr(plugin_scanner, "get_session", lambda: session)
+    scanner = PluginScanner(ScanConfig(min_installs=1000, limit=3))
+
+    assert len(scanner.scan_page(1)) == 3
+    assert session.calls.count("plugin_information") == 3
+
+    session = _RoutingSession(_listing_without_sections(20))
+    monkeypatch.setattr(plugin_scanner, "get_session", lambda: session)
+    scanner = PluginScanner(ScanConfig(min_installs=1000))
+    scanner.on_result = lambda result: scanner.stop()
+
+    assert len(scanner.scan_page(1)) == 1
+    assert session.calls.count("plugin_information") <= plugin_scanner.CHANGELOG_FETCH_THREADS
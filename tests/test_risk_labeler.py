@@ -0,0 +1,25 @@
+from analyzers.risk_labeler import apply_relative_risk_labels
+
+
+def _label(scores):
+    items = [{"score": score, "relative_risk": "stale"} for score in scores]
+    apply_relative_risk_labels(
+        items,
+        get_score=lambda item: item["score"],
+        set_label=lambda item, label: item.__setitem__("relative_risk", label),
+    )
+    return [item["relative_risk"] for item in items]
+
+
+def test_small_samples_use_absolute_buckets_with_critical_guardrail():
+    assert _label([70, 45, 25, 5, None]) == ["CRITICAL", "HIGH", "MEDIUM", "LOW", "LOW"]
+
+
+def test_large_samples_use_percentiles_and_keep_tie_order():
+    labels = _label([10, 30, 30, 90, 5, 1, 2, 3, 4, 50])
+
+    assert labels[3] == "CRITICAL"
+    assert labels[9] == "HIGH"
+    assert [labels[1], labels[2]] == ["HIGH", "MEDIUM"]
+    assert labels.count("MEDIUM") == 3
+    assert labels.count("LOW") == 4
@@ -50,6 +50,9 @@ class _RepoStub:
             return list(self.previous_slugs)
         return []
 
+    def have_same_result_slugs(self, session_id, other_session_id):
+        return set(self.get_result_slugs(session_id)) == set(self.get_result_slugs(other_session_id))
+
     def delete_session(self, session_id):
         self.deleted_sessions.append(session_id)
         return True
@@ -228,19 +231,75 @@ def test_run_scan_task_marks_failed_on_exception(monkeypatch):
 
     asyncio.run(scans_service.run_scan_task(123, _build_config(), repo))
 
-    assert repo.updated[0]["status"] == ScanStatus.RUNNING.value
-    assert repo.updated[1] == {
-        "session_id": 123,
-        "status": ScanStatus.FAILED.value,
-        "total_found": None,
-        "high_risk_count": None,
-        "error_message": "scanner exploded",
-    }
-    assert events[0] == (123, {"type": "start", "session_id": 123})
-    assert events[1] == (123, {"type": "error", "message": "scanner exploded"})
+    assert repo.updated == [
+        {
+            "session_id": 123,
+            "status": ScanStatus.FAILED.value,
+            "total_found": None,
+            "high_risk_count": None,
+            "error_message": "scanner exploded",
+        }
+    ]
+    assert events == [(123, {"type": "error", "message": "scanner exploded"})]
     assert 123 not in scans_service.active_scans
 
 
+def test_queued_scan_is_marked_running_only_when_a_worker_picks_it_up(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    repo = _RepoStub()
+    sent = []
+    monkeypatch.setattr(
+        scans_service, "SCAN_EXECUTOR", ThreadPoolExecutor(max_workers=1)
+    )
+    monkeypatch.setattr(
+        scans_service,
+        "_send_session_event_threadsafe",
+        lambda loop, session_id, payload: sent.append((session_id, payload["type"])),
+    )
+
+    class _Scanner:
+        def __init__(self, gate):
+            self.gate = gate
+
+        def scan(self):
+            self.gate.wait()
+
+    class _Batcher:
+        def flush(self):
+            pass
+
+    async def _run():
+        import threading
+
+        loop = asyncio.get_running_loop()
+        gates = {1: threading.Event(), 2: threading.Event()}
+        futures = [
+            loop.run_in_executor(
+                scans_service.SCAN_EXECUTOR,
+                scans_service._run_scanner_and_flush,
+                _Scanner(gates[session_id]),
+                _Batcher(),
+                lambda session_id=session_id: scans_service._mark_scan_running(
+                    loop=loop, session_id=session_id, repo=repo
+                ),
+            )
+            for session_id in (1, 2)
+        ]
+        await asyncio.sleep(0.05)
+        assert sent == [(1, "start")]
+        assert [update["session_id"] for update in repo.updated] == [1]
+
+        gates[1].set()
+        gates[2].set()
+        await asyncio.gather(*futures)
+
+    asyncio.run(_run())
+
+    assert sent == [(1, "start"), (2, "start")]
+    assert all(update["status"] == ScanStatus.RUNNING.value for update in repo.updated)
+
+
 def test_create_scan_session_enqueues_background_task():
     class _BackgroundStub:
         def __init__(self):
@@ -289,3 +348,277 @@ def test_create_scan_session_enqueues_background_task():
     assert args[0] == 321
     assert args[1] == scans_service.build_scan_config(request)
     assert args[2] is repo
+
+
+def test_result_batcher_saves_in_batches_before_emitting_in_order(monkeypatch):
+    saved_batches = []
+    sent = []
+
+    class _BatchRepo:
+        def save_results(self, session_id, results):
+            saved_batches.append((session_id, [result.slug for result in results]))
+            for result in results:
+                result.is_duplicate = True
+
+    monkeypatch.setattr(scans_service, "RESULT_BATCH_SIZE", 2)
+    monkeypatch.setattr(scans_service, "RESULT_BATCH_MAX_DELAY_SECONDS", 3600)
+    monkeypatch.setattr(
+        scans_service,
+        "_send_session_event_threadsafe",
+        lambda loop, session_id, payload: sent.append(payload),
+    )
+    batcher = scans_service._ResultBatcher(loop=None, session_id=7, repo=_BatchRepo())
+
+    def _result(slug):
+        return scans_service._build_theme_plugin_result({"slug": slug, "name": slug})
+
+    batcher.add(_result("a"))
+    batcher.flush_if_due()
+    assert saved_batches == [] and sent == []
+
+    batcher.add(_result("b"))
+    batcher.add(_result("c"))
+    batcher.flush()
+    batcher.flush()
+
+    assert saved_batches == [(7, ["a", "b"]), (7, ["c"])]
+    assert [(event["data"]["slug"], event["found_count"]) for event in sent] == [
+        ("a", 1),
+        ("b", 2),
+        ("c", 3),
+    ]
+    assert all(event["data"]["is_duplicate"] for event in sent)
+    assert batcher.found_count == 3
+
+
+def test_result_batcher_keeps_batch_queued_when_save_fails(monkeypatch):
+    import sqlite3
+
+    import pytest
+
+    saved = []
+    sent = []
+
+    class _FlakyRepo:
+        def __init__(self):
+            self.failures = 1
+
+        def save_results(self, session_id, results):
+            if self.failures:
+                self.failures -= 1
+                raise sqlite3.OperationalError("database is locked")
+            saved.extend(result.slug for result in results)
+
+    monkeypatch.setattr(scans_service, "RESULT_BATCH_SIZE", 2)
+    monkeypatch.setattr(scans_service, "RESULT_BATCH_MAX_DELAY_SECONDS", 3600)
+    monkeypatch.setattr(
+        scans_service,
+        "_send_session_event_threadsafe",
+        lambda loop, session_id, payload: sent.append(payload["found_count"]),
+    )
+    batcher = scans_service._ResultBatcher(loop=None, session_id=7, repo=_FlakyRepo())
+
+    def _result(slug):
+        return scans_service._build_theme_plugin_result({"slug": slug, "name": slug})
+
+    batcher.add(_result("a"))
+    with pytest.raises(sqlite3.OperationalError):
+        batcher.add(_result("b"))
+    assert saved == [] and sent == []
+
+    batcher.add(_result("c"))
+
+    assert saved == ["a", "b", "c"]
+    assert sent == [1, 2, 3]
+    assert batcher.found_count == 3
+
+
+def test_progress_throttle_sends_leading_trailing_and_final_updates(monkeypatch):
+    sent = []
+    monkeypatch.setattr(scans_service, "PROGRESS_MIN_INTERVAL_SECONDS", 0.05)
+    monkeypatch.setattr(
+        scans_service,
+        "_send_session_event_threadsafe",
+        lambda loop, session_id, payload: sent.append((payload["current"], payload["total"])),
+    )
+
+    async def _run():
+        throttle = scans_service._ProgressThrottle(
+            loop=asyncio.get_running_loop(), session_id=1
+        )
+        for current in range(1, 5):
+            throttle.update(current, 10)
+        assert sent == [(1, 10)]
+        await asyncio.sleep(0.1)
+        assert sent == [(1, 10), (4, 10)]
+
+        throttle.update(5, 10)
+        throttle.update(6, 10)
+        throttle.update(10, 10)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(_run())
+
+    assert sent == [(1, 10), (4, 10), (5, 10), (10, 10)]
+
+
+def test_progress_throttle_close_drops_pending_update_before_terminal_event(monkeypatch):
+    sent = []
+    monkeypatch.setattr(scans_service, "PROGRESS_MIN_INTERVAL_SECONDS", 0.05)
+    monkeypatch.setattr(
+        scans_service,
+        "_send_session_event_threadsafe",
+        lambda loop, session_id, payload: sent.append(("progress", payload["current"])),
+    )
+
+    async def _run():
+        loop = asyncio.get_running_loop()
+        throttle = scans_service._ProgressThrottle(loop=loop, session_id=1)
+
+        def _worker():
+            throttle.update(3, 10)
+            throttle.update(4, 10)
+
+        await loop.run_in_executor(None, _worker)
+        throttle.close()
+        sent.append(("cancelled", None))
+        throttle.update(5, 10)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(_run())
+
+    assert sent == [("progress", 3), ("cancelled", None)]
+
+
+def test_have_same_result_slugs_compares_slug_sets_in_sqlite(tmp_path):
+    from database.models import init_db
+    from database.repository import ScanRepository
+
+    db_path = tmp_path / "sessions.db"
+    init_db(db_path)
+    repo = ScanRepository(db_path=db_path)
+    sessions = [repo.create_session(_build_config()) for _ in range(3)]
+
+    def _result(slug):
+        return scans_service._build_theme_plugin_result({"slug": slug, "name": slug})
+
+    repo.save_results(sessions[0], [_result("a"), _result("b"), _result("b")])
+    repo.save_results(sessions[1], [_result("b"), _result("a")])
+    repo.save_results(sessions[2], [_result("a")])
+
+    assert repo.have_same_result_slugs(sessions[0], sessions[1]) is True
+    assert repo.have_same_result_slugs(sessions[0], sessions[2]) is False
+    assert repo.have_same_result_slugs(sessions[2], sessions[0]) is False
+
+
+def test_default_session_results_order_is_served_by_an_index(tmp_path):
+    import sqlite3
+
+    from database.models import init_db
+
+    db_path = tmp_path / "sessions.db"
+    init_db(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE INDEX idx_results_session ON scan_results(session_id)")
+    conn.commit()
+    conn.close()
+    init_db(db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        indexes = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'scan_results'"
+            )
+        }
+        delete_plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN DELETE FROM scan_results WHERE session_id = ?", (1,)
+            )
+        )
+        plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM scan_results WHERE session_id = ? "
+                "ORDER BY score DESC LIMIT ?",
+                (1, 10),
+            )
+        )
+    finally:
+        conn.close()
+
+    assert "idx_results_session_score" in plan
+    assert "TEMP B-TREE" not in plan
+    assert "idx_results_session" not in indexes
+    assert "idx_results_session_score" in delete_plan
+
+
+def test_latest_semgrep_status_lookup_is_served_by_an_index(tmp_path):
+    import sqlite3
+
+    from database.models import init_db
+
+    db_path = tmp_path / "semgrep.db"
+    init_db(db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT slug, MAX(id) FROM semgrep_scans "
+                "WHERE slug IN (?, ?) GROUP BY slug",
+                ("akismet", "hello-dolly"),
+            )
+        )
+    finally:
+        conn.close()
+
+    assert "idx_semgrep_scans_slug" in plan
+    assert "SCAN semgrep_scans" not in plan
+
+
+def test_get_scan_session_results_caches_only_finished_sessions(monkeypatch):
+    monkeypatch.setattr(scans_service, "_session_results_cache", scans_service.TTLCache(60))
+
+    class _ResultsRepo:
+        def __init__(self):
+            self.status = ScanStatus.RUNNING.value
+            self.result_reads = 0
+
+        def get_session(self, session_id):
+            return {"id": session_id, "status": self.status}
+
+        def get_session_results(self, session_id, sort_by, sort_order, limit):
+            self.result_reads += 1
+            return [{"slug": "akismet", "score": 10}]
+
+        def get_semgrep_statuses_for_slugs(self, slugs):
+            return {"akismet": {"status": "completed"}}
+
+        def delete_session(self, session_id):
+            return True
+
+    repo = _ResultsRepo()
+
+    def _fetch():
+        return scans_service.get_scan_session_results(
+            repo=repo, session_id=5, sort_by="score", sort_order="desc", limit=100
+        )
+
+    _fetch()
+    _fetch()
+    assert repo.result_reads == 2
+
+    repo.status = ScanStatus.COMPLETED.value
+    first = _fetch()
+    second = _fetch()
+    assert repo.result_reads == 3
+    assert second == first
+    assert second["results"][0]["semgrep"] == {"status": "completed"}
+    assert second["results"][0] is not first["results"][0]
+
+    scans_service.delete_scan_session(repo=repo, session_id=5)
+    _fetch()
+    assert repo.result_reads == 4
+
@@ -3,6 +3,7 @@ import os
 import tempfile
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 
 from server.routers import semgrep_helpers
@@ -571,6 +572,47 @@ def test_semgrep_helpers_load_custom_rules_extracts_pattern_from_patterns_array(
     assert rules[0]["pattern"] == "eval($X)"
 
 
+def test_semgrep_helpers_reuse_custom_rules_parse_until_file_changes(monkeypatch, tmp_path):
+    _patch_semgrep_state(monkeypatch, tmp_path)
+    save_custom_rules_document({"rules": [{"id": "demo-rule", "message": "Demo", "severity": "WARNING", "pattern": "eval($X)"}]})
+    parses = []
+    real_load = semgrep_helpers.yaml.load
+
+    def _counting_load(stream, Loader):
+        parses.append(Loader)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(semgrep_helpers.yaml, "load", _counting_load)
+
+    semgrep_helpers.load_custom_rules()
+    document = semgrep_helpers.load_custom_rules_document()
+    document["rules"].append({"id": "unsaved"})
+    assert [rule["id"] for rule in semgrep_helpers.load_custom_rules()] == ["demo-rule"]
+    assert parses == []
+
+    save_custom_rules_document(document)
+    assert [rule["id"] for rule in semgrep_helpers.load_custom_rules()] == ["demo-rule", "unsaved"]
+    assert parses == []
+
+    custom_rules_path = semgrep_helpers.CUSTOM_RULES_PATH
+    custom_rules_path.write_text("rules:\n  - id: edited-by-hand\n", encoding="utf-8")
+    assert [rule["id"] for rule in semgrep_helpers.load_custom_rules()] == ["edited-by-hand"]
+    assert len(parses) == 1
+
+
+def test_save_custom_rules_document_replaces_file_atomically_and_seeds_cache(monkeypatch, tmp_path):
+    state_dir = _patch_semgrep_state(monkeypatch, tmp_path)
+    document = {"rules": [{"id": "demo-rule", "message": "Demo", "severity": "WARNING", "pattern": "eval($X)"}]}
+    save_custom_rules_document(document)
+    monkeypatch.setattr(semgrep_helpers.yaml, "load", lambda *args, **kwargs: pytest.fail("re-parsed"))
+
+    loaded = semgrep_helpers.load_custom_rules_document()
+
+    assert loaded == document
+    assert loaded is not document
+    assert sorted(path.name for path in state_dir.iterdir()) == ["custom_rules.yaml"]
+
+
 def test_semgrep_rules_endpoint_returns_bootstrapped_rule_enabled_by_default(monkeypatch, tmp_path):
     _patch_semgrep_state(monkeypatch, tmp_path)
     legacy_rules_path = tmp_path / "legacy-semgrep-results" / "custom_rules.yaml"
@@ -0,0 +1,20 @@
+from infrastructure import semgrep_runtime
+
+
+def test_get_semgrep_command_skips_candidates_that_cannot_exist(monkeypatch):
+    probed = []
+    monkeypatch.setattr(semgrep_runtime.shutil, "which", lambda name: None)
+    monkeypatch.setattr(semgrep_runtime.importlib.util, "find_spec", lambda name: None)
+    monkeypatch.setattr(
+        semgrep_runtime,
+        "_is_working_semgrep_command",
+        lambda command: probed.append(list(command)) or False,
+    )
+    semgrep_runtime.get_semgrep_command.cache_clear()
+    try:
+        assert semgrep_runtime.get_semgrep_command() is None
+    finally:
+        semgrep_runtime.get_semgrep_command.cache_clear()
+
+    assert ["semgrep"] not in probed
+    assert not any("-m" in command for command in probed)
@@ -1,4 +1,5 @@
 import json
+import subprocess
 from pathlib import Path
 
 import yaml
@@ -9,6 +10,7 @@ from server.routers import semgrep_helpers, semgrep_task_service
 
 from database.models import get_db, init_db
 from database.repository import ScanRepository
+from scanners import semgrep_scanner
 from scanners.semgrep_scanner import SemgrepScanner
 from server.routers.semgrep_service import start_semgrep_scan_for_plugin
 
@@ -343,3 +345,213 @@ def test_semgrep_scanner_skips_invalid_custom_rules_instead_of_disabling_scan(tm
     invalid_log = output_dir / "invalid_custom_rules.json"
     assert invalid_log.exists()
     assert 'invalid-rule' in invalid_log.read_text(encoding='utf-8')
+
+
+def test_semgrep_scanner_reads_report_file_and_discards_stdout(tmp_path, monkeypatch):
+    output_dir = tmp_path / "semgrep-exec-output"
+    plugin_dir = tmp_path / "plugin"
+    plugin_dir.mkdir()
+    popen_calls = []
+    popen_commands = []
+
+    class FakeProcess:
+        returncode = 1
+
+        def __init__(self, command, **kwargs):
+            popen_calls.append(kwargs)
+            popen_commands.append(command)
+            report_path = command[command.index("--output") + 1]
+            with open(report_path, "w", encoding="utf-8") as handle:
+                json.dump({"results": [{"check_id": "rule-1", "path": "a.php"}], "errors": []}, handle)
+
+        def communicate(self, timeout=None):
+            return None, "scan summary"
+
+    monkeypatch.setattr("scanners.semgrep_scanner.subprocess.Popen", FakeProcess)
+    scanner = SemgrepScanner(output_dir=str(output_dir), use_registry_rules=False)
+    scanner.semgrep_command = ["semgrep"]
+    monkeypatch.setattr(scanner, "_get_config_args", lambda: [])
+
+    result = scanner.scan_plugin(str(plugin_dir), "plugin")
+
+    assert result.success is True
+    assert [finding["check_id"] for finding in result.findings] == ["rule-1"]
+    assert popen_calls[0]["stdout"] is subprocess.DEVNULL
+    assert popen_commands[0][-1] == str(plugin_dir.resolve())
+    assert popen_commands[0][:2] == ["semgrep", "--disable-version-check"]
+    assert popen_commands[0][popen_commands[0].index("--max-memory") + 1] == "2048"
+    expected_jobs = max(
+        1,
+        semgrep_scanner._available_cpu_count() // semgrep_scanner.SEMGREP_MAX_CONCURRENT_SCANS,
+    )
+    assert popen_commands[0][popen_commands[0].index("--jobs") + 1] == str(expected_jobs)
+    assert popen_commands[0][popen_commands[0].index("*.min.js") - 1] == "--exclude"
+
+
+def test_semgrep_job_count_splits_cpus_across_concurrent_scans(monkeypatch):
+    monkeypatch.setattr(semgrep_scanner, "SEMGREP_MAX_CONCURRENT_SCANS", 4)
+
+    monkeypatch.setattr(semgrep_scanner, "_available_cpu_count", lambda: 16)
+    assert semgrep_scanner._semgrep_job_count() == 4
+
+    monkeypatch.setattr(semgrep_scanner, "_available_cpu_count", lambda: 2)
+    assert semgrep_scanner._semgrep_job_count() == 1
+
+    assert semgrep_task_service.SEMGREP_WORKERS == semgrep_scanner.SEMGREP_MAX_CONCURRENT_SCANS
+
+
+def test_semgrep_scanner_rejects_shell_metacharacters_in_target_path(tmp_path):
+    plugin_dir = tmp_path / "plugin;rm"
+    plugin_dir.mkdir()
+    scanner = SemgrepScanner(output_dir=str(tmp_path / "out"))
+
+    result = scanner._validate_scan_target(str(plugin_dir), "plugin")
+
+    assert result.errors == ["Invalid characters in path"]
+    assert scanner._validate_scan_target(str(tmp_path), "bad slug").errors == ["Invalid slug format"]
+    assert scanner._validate_scan_target(str(tmp_path), "plugin\n").errors == ["Invalid slug format"]
+
+
+def test_semgrep_scanner_reuses_custom_rule_validation_across_scans(tmp_path, monkeypatch):
+    from scanners import semgrep_scanner
+
+    validate_calls = []
+
+    class _Completed:
+        returncode = 0
+
+    def fake_run(command, **kwargs):
+        validate_calls.append(command)
+        return _Completed()
+
+    monkeypatch.setattr(semgrep_scanner, "_rule_validation_cache", {})
+    monkeypatch.setattr(semgrep_scanner.subprocess, "run", fake_run)
+    rule = {"id": "valid-rule", "pattern": "eval(...)", "message": "m", "languages": ["php"], "severity": "ERROR"}
+
+    for name in ("first", "second"):
+        scanner = SemgrepScanner(output_dir=str(tmp_path / name), use_registry_rules=False)
+        scanner.semgrep_command = ["semgrep"]
+        assert scanner._validate_custom_rule(rule) is True
+
+    assert len(validate_calls) == 1
+    assert scanner._validate_custom_rule(dict(rule, pattern="exec(...)")) is True
+    assert len(validate_calls) == 2
+
+
+def test_semgrep_scanner_uses_custom_rules_file_directly_when_nothing_is_filtered(tmp_path, monkeypatch):
+    output_dir = tmp_path / "semgrep-unfiltered-output"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    custom_rules_path = output_dir / "custom_rules.yaml"
+    with open(custom_rules_path, "w", encoding="utf-8") as handle:
+        yaml.dump(
+            {"rules": [{"id": "rule-a", "pattern": "eval(...)", "message": "m", "languages": ["php"], "severity": "ERROR"}]},
+            handle,
+            sort_keys=False,
+        )
+
+    scanner = SemgrepScanner(output_dir=str(output_dir), use_registry_rules=False)
+    monkeypatch.setattr(scanner, "_validate_custom_rule", lambda rule: True)
+
+    assert scanner._filter_custom_rules() == str(custom_rules_path)
+    assert not (output_dir / "active_custom_rules.yaml").exists()
+
+
+def test_semgrep_scanner_reports_invalid_json_output(tmp_path):
+    output_file = tmp_path / "plugin_results.json"
+    output_file.write_bytes(b'{"results": [')
+
+    parsed = SemgrepScanner(output_dir=str(tmp_path))._parse_output_file(output_file, "boom")
+
+    assert parsed.success is False
+    assert parsed.errors == ["Invalid JSON output from Semgrep. Stderr: boom"]
+
+
+def test_semgrep_scanner_treats_per_file_memory_limits_as_non_fatal(tmp_path):
+    scanner = SemgrepScanner(output_dir=str(tmp_path))
+
+    assert scanner._is_non_fatal_semgrep_error("OutOfMemory when running rule-1 on big.php")
+    assert not scanner._is_non_fatal_semgrep_error("Invalid rule schema")
+
+
+def test_semgrep_scanner_kills_running_process_when_stopped(tmp_path, monkeypatch):
+    plugin_dir = tmp_path / "plugin"
+    plugin_dir.mkdir()
+    scanner = SemgrepScanner(output_dir=str(tmp_path / "out"), use_registry_rules=False)
+    scanner.semgrep_command = ["semgrep"]
+    monkeypatch.setattr(scanner, "_get_config_args", lambda: [])
+    monkeypatch.setattr("scanners.semgrep_scanner.STOP_POLL_INTERVAL_SECONDS", 0.01)
+
+    class RunningProcess:
+        returncode = None
+        killed = False
+
+        def __init__(self, command, **kwargs):
+            RunningProcess.instance = self
+
+        def communicate(self, timeout=None):
+            if self.killed:
+                return None, ""
+            scanner.stop()
+            raise subprocess.TimeoutExpired("semgrep", timeout)
+
+        def kill(self):
+            self.killed = True
+
+    monkeypatch.setattr("scanners.semgrep_scanner.subprocess.Popen", RunningProcess)
+
+    result = scanner.scan_plugin(str(plugin_dir), "plugin")
+
+    assert RunningProcess.instance.killed is True
+    assert result.success is False
+    assert result.errors == ["Stopped"]
+
+
+def test_execute_semgrep_scan_forwards_stop_requests_to_scanner(tmp_path, monkeypatch):
+    import asyncio
+    import threading
+
+    class BlockingScanner:
+        def __init__(self, **kwargs):
+            self.stopped = threading.Event()
+
+        def scan_plugin(self, plugin_path, slug):
+            assert self.stopped.wait(timeout=5)
+            return "stopped-result"
+
+        def stop(self):
+            self.stopped.set()
+
+    monkeypatch.setattr(semgrep_task_service, "SemgrepScanner", BlockingScanner)
+    monkeypatch.setattr(semgrep_task_service, "get_active_rulesets", lambda: [])
+
+    async def run():
+        stop_event = asyncio.Event()
+        task = asyncio.create_task(
+            semgrep_task_service.execute_semgrep_scan(
+                output_dir=tmp_path, plugin_path=str(tmp_path), slug="akismet", stop_event=stop_event
+            )
+        )
+        await asyncio.sleep(0.01)
+        stop_event.set()
+        return await task
+
+    assert asyncio.run(run()) == "stopped-result"
+
+
+def test_build_semgrep_summary_counts_severities_in_one_pass():
+    summary = semgrep_task_service.build_semgrep_summary(
+        [
+            {"extra": {"severity": "ERROR"}},
+            {"extra": {"severity": "ERROR"}},
+            {"extra": {"severity": "CRITICAL"}},
+            {},
+        ],
+        errors=["partial"],
+    )
+
+    assert summary == {
+        "total_findings": 4,
+        "breakdown": {"ERROR": 2, "WARNING": 0, "INFO": 1, "CRITICAL": 1},
+        "errors": ["partial"],
+    }
+    assert list(summary["breakdown"]) == ["ERROR", "WARNING", "INFO", "CRITICAL"]
@@ -0,0 +1,99 @@
+import json
+
+from scanners import theme_scanner
+from scanners.theme_scanner import ThemeScanner
+
+
+def test_process_theme_matches_risky_tags_from_tags_and_description():
+    result = ThemeScanner().process_theme(
+        {
+            "name": "Shop Theme",
+            "slug": "shop-theme",
+            "downloaded": 500,
+            "last_updated": "2015-01-01",
+            "tags": {"ecommerce": "E-Commerce", "blog": "Blog"},
+            "description": "Includes a contact form and ajax search.",
+        }
+    )
+
+    assert sorted(result["matched_tags"]) == ["ajax", "contact", "ecommerce", "form"]
+    assert result["risk_score"] == 70
+    assert result["risk_level"] == "HIGH"
+    assert result["wp_org_link"] == "https://wordpress.org/themes/shop-theme/"
+    assert result["cve_search_link"] == "https://cve.mitre.org/cgi-bin/cvekey.cgi?keyword=shop-theme"
+    assert ThemeScanner().process_theme({"tags": []})["matched_tags"] == []
+
+
+class _FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode("utf-8")
+
+
+class _PagedSession:
+    def __init__(self, pages, reported_pages=None):
+        self.pages = pages
+        self.reported_pages = reported_pages
+        self.requested = []
+
+    def get(self, url, params=None, timeout=None):
+        page = params["request[page]"]
+        self.requested.append(page)
+        themes = self.pages.get(page)
+        if themes is None:
+            return _FakeResponse(429, {})
+        payload = {"themes": themes}
+        if self.reported_pages is not None:
+            payload["info"] = {"page": page, "pages": self.reported_pages}
+        return _FakeResponse(200, payload)
+
+
+def _theme(slug):
+    return {"name": slug, "slug": slug, "downloaded": 5000, "last_updated": "2024-01-01", "tags": {}}
+
+
+def test_scan_fetches_pages_concurrently_and_emits_in_page_order(monkeypatch):
+    session = _PagedSession({1: [_theme("a"), _theme("b")], 2: [_theme("c")], 3: [_theme("d")]})
+    monkeypatch.setattr(theme_scanner, "get_session", lambda: session)
+    progress = []
+
+    results = ThemeScanner(pages=3, on_progress=lambda current, total: progress.append(current)).scan()
+
+    assert [result["slug"] for result in results] == ["a", "b", "c", "d"]
+    assert sorted(session.requested) == [1, 2, 3]
+    assert progress == [1, 2, 3]
+
+
+def test_concurrent_scan_stops_when_the_catalogue_runs_out(monkeypatch):
+    pages = {page: [] for page in range(2, 11)}
+    pages[1] = [_theme("a")]
+    session = _PagedSession(pages, reported_pages=1)
+    monkeypatch.setattr(theme_scanner, "get_session", lambda: session)
+    progress = []
+
+    results = ThemeScanner(
+        pages=10, on_progress=lambda current, total: progress.append((current, total))
+    ).scan()
+
+    assert [result["slug"] for result in results] == ["a"]
+    assert session.requested == [1]
+    assert progress == [(1, 1)]
+
+    session = _PagedSession(pages)
+    monkeypatch.setattr(theme_scanner, "get_session", lambda: session)
+
+    results = ThemeScanner(pages=10).scan()
+
+    assert [result["slug"] for result in results] == ["a"]
+    assert max(session.requested) <= 1 + theme_scanner.THEME_FETCH_THREADS
+
+
+def test_scan_with_limit_stops_fetching_once_limit_is_reached(monkeypatch):
+    session = _PagedSession({1: [_theme("a"), _theme("b")], 2: [_theme("c")]})
+    monkeypatch.setattr(theme_scanner, "get_session", lambda: session)
+
+    results = ThemeScanner(pages=2, limit=1).scan()
+
+    assert [result["slug"] for result in results] == ["a"]
+    assert session.requested == [1]
+    assert ThemeScanner().fetch_themes(9) == []
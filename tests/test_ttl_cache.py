@@ -0,0 +1,20 @@
+from infrastructure import ttl_cache
+from infrastructure.ttl_cache import TTLCache
+
+
+def test_ttl_cache_expires_evicts_oldest_and_invalidates(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl_seconds=10, max_entries=2)
+
+    cache.set(("a", 1), "first")
+    cache.set(("b", 1), "second")
+    cache.set(("b", 2), "third")
+    assert cache.get(("a", 1)) is None
+    assert cache.get(("b", 1)) == "second"
+
+    cache.invalidate(lambda key: key[1] == 2)
+    assert cache.get(("b", 2)) is None
+
+    now[0] += 10
+    assert cache.get(("b", 1)) is None
@@ -0,0 +1,174 @@
+import asyncio
+import json
+
+from server import websockets
+from server.websockets import ConnectionManager
+
+
+class _FakeWebSocket:
+    def __init__(self, fail=False, gate=None):
+        self.fail = fail
+        self.gate = gate
+        self.frames = []
+        self.close_codes = []
+
+    async def close(self, code=1000):
+        self.close_codes.append(code)
+        if self.gate is not None:
+            await self.gate.wait()
+
+    async def send_bytes(self, data):
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("socket closed")
+        self.frames.append(json.loads(data))
+
+
+def test_send_to_session_delivers_to_all_and_drops_failed_connections():
+    async def run():
+        manager = ConnectionManager()
+        healthy, broken = _FakeWebSocket(), _FakeWebSocket(fail=True)
+        manager.active_connections[7] = {healthy, broken}
+
+        await manager.send_to_session(7, {"type": "start"})
+
+        assert healthy.frames == [{"type": "start"}]
+        assert manager.active_connections[7] == {healthy}
+        assert broken.close_codes == [1011]
+        assert healthy.close_codes == []
+
+    asyncio.run(run())
+
+
+def test_events_queued_during_a_send_are_coalesced_in_order():
+    async def run():
+        manager = ConnectionManager()
+        gate = asyncio.Event()
+        socket = _FakeWebSocket(gate=gate)
+        manager.active_connections[7] = {socket}
+        loop = asyncio.get_running_loop()
+
+        manager.publish_threadsafe(loop, 7, {"type": "result", "found_count": 1})
+        await asyncio.sleep(0)
+        manager.publish_threadsafe(loop, 7, {"type": "result", "found_count": 2})
+        manager.publish_threadsafe(loop, 7, {"type": "progress", "current": 1})
+        await asyncio.sleep(0)
+        gate.set()
+        await manager.send_to_session(7, {"type": "complete"})
+
+        assert socket.frames == [
+            {"type": "result", "found_count": 1},
+            {
+                "type": "batch",
+                "events": [
+                    {"type": "result", "found_count": 2},
+                    {"type": "progress", "current": 1},
+                    {"type": "complete"},
+                ],
+            },
+        ]
+        assert manager._flushers == {}
+
+    asyncio.run(run())
+
+
+def test_stalled_connection_times_out_without_blocking_others(monkeypatch):
+    monkeypatch.setattr(websockets, "SEND_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr(websockets, "CLOSE_TIMEOUT_SECONDS", 0.01)
+
+    async def run():
+        manager = ConnectionManager()
+        healthy, stalled = _FakeWebSocket(), _FakeWebSocket(gate=asyncio.Event())
+        manager.active_connections[7] = {stalled, healthy}
+
+        await manager.send_to_session(7, {"type": "progress"})
+
+        assert healthy.frames == [{"type": "progress"}]
+        assert manager.active_connections[7] == {healthy}
+        assert stalled.close_codes == [1011]
+
+    asyncio.run(run())
+
+
+def test_connect_and_disconnect_track_sockets_per_session():
+    class _AcceptingWebSocket(_FakeWebSocket):
+        async def accept(self):
+            pass
+
+    async def run():
+        manager = ConnectionManager()
+        first, second = _AcceptingWebSocket(), _AcceptingWebSocket()
+        await manager.connect(first, 3)
+        await manager.connect(second, 3)
+        assert manager.active_connections[3] == {first, second}
+
+        await manager.disconnect(first, 3)
+        await manager.disconnect(first, 3)
+        assert manager.active_connections[3] == {second}
+
+        await manager.disconnect(second, 3)
+        assert 3 not in manager.active_connections
+
+    asyncio.run(run())
+
+
+def test_large_batches_are_encoded_off_the_event_loop(monkeypatch):
+    offloaded = []
+    real_to_thread = asyncio.to_thread
+
+    async def _recording_to_thread(func, *args):
+        offloaded.append(func)
+        return await real_to_thread(func, *args)
+
+    monkeypatch.setattr(websockets, "OFFLOAD_ENCODE_MIN_EVENTS", 2)
+    monkeypatch.setattr(websockets.asyncio, "to_thread", _recording_to_thread)
+
+    async def run():
+        manager = ConnectionManager()
+        socket = _FakeWebSocket()
+        manager.active_connections[7] = {socket}
+
+        await manager._broadcast(7, {"type": "progress"})
+        assert offloaded == []
+
+        batch = {"type": "batch", "events": [{"type": "a"}, {"type": "b"}]}
+        await manager._broadcast(7, batch)
+        assert offloaded == [websockets._encode_frame]
+        assert socket.frames == [{"type": "progress"}, batch]
+
+    asyncio.run(run())
+
+
+def test_unencodable_event_is_dropped_without_losing_its_neighbours():
+    async def run():
+        manager = ConnectionManager()
+        gate = asyncio.Event()
+        socket = _FakeWebSocket(gate=gate)
+        manager.active_connections[7] = {socket}
+        loop = asyncio.get_running_loop()
+
+        manager.publish_threadsafe(loop, 7, {"type": "progress", "current": 1})
+        await asyncio.sleep(0)
+        manager.publish_threadsafe(loop, 7, {"type": "result", "found_count": 1})
+        manager.publish_threadsafe(loop, 7, {"type": "result", "data": object()})
+        await asyncio.sleep(0)
+        gate.set()
+        await manager.send_to_session(7, {"type": "complete"})
+        await manager.send_to_session(7, {"type": "bad", "data": {1, 2}})
+        await manager.send_to_session(7, {"type": "after"})
+
+        assert socket.frames == [
+            {"type": "progress", "current": 1},
+            {
+                "type": "batch",
+                "events": [
+                    {"type": "result", "found_count": 1},
+                    {"type": "complete"},
+                ],
+            },
+            {"type": "after"},
+        ]
+        assert manager._flushers == {}
+
+    asyncio.run(run())
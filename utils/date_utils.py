@@ -2,17 +2,40 @@
 Date Utilities
 """
 
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional
 
+UNKNOWN_DAYS_AGO = 9999
 
-def calculate_days_ago(date_str: Optional[str]) -> int:
-    """Calculates number of days since the given date string."""
-    if not date_str:
-        return 9999
+
+@lru_cache(maxsize=4096)
+def _date_ordinal(day_str: str) -> Optional[int]:
+    """Parse a ``YYYY-MM-DD`` date into a proleptic ordinal (cached per value)."""
     try:
-        date_obj = datetime.strptime(date_str.split(" ")[0], "%Y-%m-%d")
-        delta = datetime.now() - date_obj
-        return delta.days
+        return date.fromisoformat(day_str).toordinal()
     except ValueError:
-        return 9999
+        pass
+    try:
+        return datetime.strptime(day_str, "%Y-%m-%d").toordinal()
+    except ValueError:
+        return None
+
+
+def today_ordinal() -> int:
+    """Return today's ordinal, for callers computing many ages in one batch."""
+    return date.today().toordinal()
+
+
+def calculate_days_ago(date_str: Optional[str], today: Optional[int] = None) -> int:
+    """Calculates number of days since the given date string.
+
+    ``today`` may be passed as a precomputed ``today_ordinal()`` to avoid
+    reading the clock once per item.
+    """
+    if not date_str:
+        return UNKNOWN_DAYS_AGO
+    ordinal = _date_ordinal(date_str.split(" ", 1)[0])
+    if ordinal is None:
+        return UNKNOWN_DAYS_AGO
+    return (today_ordinal() if today is None else today) - ordinal